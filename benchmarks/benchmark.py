@@ -0,0 +1,195 @@
+"""Benchmarks for the request, pagination and model decoding hot paths.
+
+The benchmarks run against a local aiohttp server, started in a separate process
+so its CPU time and memory are not measured. It serves synthetic paginated
+endpoints, built from the fixtures in `tests/fixtures`, with any number of pages.
+
+Run all benchmarks, and print the results as JSON to compare runs:
+
+    uv run python -m benchmarks.benchmark --pages 2000 --json > before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from aiohttp import web
+
+from pyfirefly import Firefly
+from pyfirefly.models import Account, Bill, Budget, BudgetLimit, Category, TransactionResource
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from multiprocessing.queues import Queue
+
+    from mashumaro.mixins.orjson import DataClassORJSONMixin
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+CONTENT_TYPE = "application/vnd.api+json"
+
+DECODE_MODELS: dict[str, tuple[type[DataClassORJSONMixin], str]] = {
+    "Account": (Account, "accounts.json"),
+    "TransactionResource": (TransactionResource, "account_transactions.json"),
+    "Category": (Category, "categories.json"),
+    "Bill": (Bill, "bills.json"),
+    "Budget": (Budget, "budgets.json"),
+    "BudgetLimit": (BudgetLimit, "budget_limits.json"),
+}
+
+
+def load_resource(filename: str) -> dict[str, Any]:
+    """Load the first resource of a fixture."""
+    resource: dict[str, Any] = json.loads((FIXTURES / filename).read_text())["data"][0]
+    return resource
+
+
+def paginated_handler(resource: dict[str, Any], total: int) -> Callable[[web.Request], Awaitable[web.Response]]:
+    """Create a handler serving `total` copies of a resource, page by page."""
+
+    async def handler(request: web.Request) -> web.Response:
+        limit = int(request.query.get("limit", 50))
+        page = int(request.query.get("page", 1))
+        first = (page - 1) * limit
+        data = [{**resource, "id": str(index)} for index in range(first, min(first + limit, total))]
+        meta = {
+            "pagination": {
+                "total": total,
+                "count": len(data),
+                "per_page": limit,
+                "current_page": page,
+                "total_pages": math.ceil(total / limit),
+            }
+        }
+        return web.Response(body=orjson.dumps({"data": data, "meta": meta}), content_type=CONTENT_TYPE)
+
+    return handler
+
+
+def serve(total: int, ready: Queue[int]) -> None:
+    """Run the stand-in Firefly server, until the process is terminated."""
+
+    async def _serve() -> None:
+        about = (FIXTURES / "about.json").read_bytes()
+
+        async def about_handler(_: web.Request) -> web.Response:
+            return web.Response(body=about, content_type=CONTENT_TYPE)
+
+        app = web.Application()
+        app.router.add_get("/api/v1/about", about_handler)
+        app.router.add_get("/api/v1/transactions", paginated_handler(load_resource("account_transactions.json"), total))
+        app.router.add_get("/api/v1/accounts", paginated_handler(load_resource("accounts.json"), total))
+
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        ready.put(runner.addresses[0][1])
+        await asyncio.Event().wait()
+
+    asyncio.run(_serve())
+
+
+async def bench_requests(api_url: str, requests: int, concurrency: int) -> dict[str, float]:
+    """Measure the number of requests per second, including decoding."""
+    async with Firefly(api_url=api_url, api_key="benchmark", max_in_flight=concurrency) as client:
+        await client.get_about()
+        start = time.perf_counter()
+        await asyncio.gather(*(client.get_about() for _ in range(requests)))
+        elapsed = time.perf_counter() - start
+    return {"requests": requests, "seconds": elapsed, "requests_per_second": requests / elapsed}
+
+
+async def bench_pagination(api_url: str, endpoint: str, pages: int, page_size: int) -> dict[str, float]:
+    """Measure end-to-end pages per second, and the peak memory, of a paginated call."""
+    async with Firefly(api_url=api_url, api_key="benchmark", page_size=page_size) as client:
+        fetch = client.get_transactions if endpoint == "transactions" else client.get_accounts
+        start = time.perf_counter()
+        items = await fetch()
+        elapsed = time.perf_counter() - start
+        del items
+
+        # Tracing memory allocations slows down the call, so measure it separately
+        tracemalloc.start()
+        items = await fetch()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    if len(items) != pages * page_size:
+        msg = f"Expected {pages * page_size} {endpoint}, got {len(items)}"
+        raise RuntimeError(msg)
+    return {
+        "pages": pages,
+        "seconds": elapsed,
+        "pages_per_second": pages / elapsed,
+        "items_per_second": len(items) / elapsed,
+        "peak_memory_mib": peak / 2**20,
+    }
+
+
+def bench_decode(iterations: int) -> dict[str, dict[str, float]]:
+    """Measure the number of `from_dict` calls per second of each model."""
+    results: dict[str, dict[str, float]] = {}
+    for name, (model, fixture) in DECODE_MODELS.items():
+        resource = load_resource(fixture)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            model.from_dict(resource)
+        elapsed = time.perf_counter() - start
+        results[name] = {"iterations": iterations, "decodes_per_second": iterations / elapsed}
+    return results
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Start the stand-in server and run all benchmarks."""
+    ready: Queue[int] = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(args.pages * args.page_size, ready), daemon=True)
+    server.start()
+    try:
+        api_url = f"http://127.0.0.1:{ready.get(timeout=30)}/"
+        return {
+            "requests": await bench_requests(api_url, args.requests, args.concurrency),
+            "get_transactions": await bench_pagination(api_url, "transactions", args.pages, args.page_size),
+            "get_accounts": await bench_pagination(api_url, "accounts", args.pages, args.page_size),
+            "decode": bench_decode(args.decode_iterations),
+        }
+    finally:
+        server.terminate()
+        server.join()
+
+
+def main() -> None:
+    """Run the benchmarks and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=2000, help="number of pages of the paginated endpoints")
+    parser.add_argument("--page-size", type=int, default=20, help="number of resources per page")
+    parser.add_argument("--requests", type=int, default=2000, help="number of requests of the request benchmark")
+    parser.add_argument("--concurrency", type=int, default=8, help="number of concurrent requests")
+    parser.add_argument("--decode-iterations", type=int, default=20000, help="number of decodes per model")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, result in results.items():
+        print(f"{name}:")
+        for key, value in result.items():
+            if isinstance(value, dict):
+                print(f"  {key}: {value['decodes_per_second']:,.0f} decodes/s")
+            else:
+                print(f"  {key}: {value:,.2f}" if isinstance(value, float) else f"  {key}: {value:,}")
+
+
+if __name__ == "__main__":
+    main()
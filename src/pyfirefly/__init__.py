@@ -1,17 +1,32 @@
 """Asynchronous Python client for Python Firefly."""
 
+from .cache import ResponseCache
+from .columnar import TransactionColumns
 from .exceptions import (
     FireflyAuthenticationError,
     FireflyConnectionError,
     FireflyError,
+    FireflyPaginationError,
     FireflyTimeoutError,
+    FireflyValidationError,
 )
+from .instrumentation import FireflyMetrics, Instrumentation, OpenTelemetryInstrumentation, RequestInfo
 from .pyfirefly import Firefly
+from .store import FireflyStore
 
 __all__ = [
     "Firefly",
     "FireflyAuthenticationError",
     "FireflyConnectionError",
     "FireflyError",
+    "FireflyMetrics",
+    "FireflyPaginationError",
+    "FireflyStore",
     "FireflyTimeoutError",
+    "FireflyValidationError",
+    "Instrumentation",
+    "OpenTelemetryInstrumentation",
+    "RequestInfo",
+    "ResponseCache",
+    "TransactionColumns",
 ]
@@ -0,0 +1,121 @@
+"""Response cache for the Firefly API client."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+class ResponseCache:
+    """In-memory LRU cache with per-endpoint TTLs for parsed Firefly responses.
+
+    The cache stores the parsed models returned by the Firefly client, keyed by
+    request URI and parameters. A cache hit skips both the HTTP round trip and
+    the decoding of the response. Cached models are shared between callers, so
+    treat them as read-only.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 128,
+        default_ttl: float = 300.0,
+        ttls: dict[str, float] | None = None,
+    ) -> None:
+        """Initialize the response cache.
+
+        Args:
+        ----
+            max_size: Maximum number of cached responses. The least recently
+                used response is evicted once the cache is full.
+            default_ttl: Time to live of a cached response (in seconds).
+            ttls: Time to live per endpoint URI (in seconds), for example,
+                `{"about": 3600}`. A TTL of 0 disables caching for that URI.
+
+        """
+        if max_size < 1:
+            msg = "max_size must be at least 1"
+            raise ValueError(msg)
+
+        self._max_size = max_size
+        self._default_ttl = default_ttl
+        self._ttls = ttls or {}
+        self._entries: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    @staticmethod
+    def _key(uri: str, params: dict[str, Any] | None) -> CacheKey:
+        """Build the cache key of a request."""
+        return uri, tuple(sorted((key, str(value)) for key, value in (params or {}).items()))
+
+    def ttl(self, uri: str) -> float:
+        """Return the time to live (in seconds) of responses for an endpoint URI."""
+        return self._ttls.get(uri, self._default_ttl)
+
+    def get(self, uri: str, params: dict[str, Any] | None = None) -> Any | None:
+        """Get a cached response.
+
+        Args:
+        ----
+            uri: Request URI, for example, 'accounts'.
+            params: The parameters of the request.
+
+        Returns:
+        -------
+            The cached response, or None if there is no fresh cached response.
+
+        """
+        key = self._key(uri, params)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, uri: str, params: dict[str, Any] | None, value: Any) -> None:
+        """Store a response in the cache.
+
+        Args:
+        ----
+            uri: Request URI, for example, 'accounts'.
+            params: The parameters of the request.
+            value: The parsed response to cache.
+
+        """
+        ttl = self.ttl(uri)
+        if ttl <= 0:
+            return
+
+        key = self._key(uri, params)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, uri: str | None = None) -> None:
+        """Invalidate cached responses.
+
+        Args:
+        ----
+            uri: Request URI to invalidate all cached responses for, regardless
+                of their parameters. Invalidates the whole cache if omitted.
+
+        """
+        if uri is None:
+            self._entries.clear()
+            return
+
+        for key in [key for key in self._entries if key[0] == uri]:
+            del self._entries[key]
@@ -0,0 +1,192 @@
+"""Columnar export of Firefly transactions."""
+
+from __future__ import annotations
+
+import importlib
+from array import array
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal, InvalidOperation
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+# Timestamp of splits without a date, equal to NaT of NumPy
+MISSING_DATE = -(2**63)
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+STRING_COLUMNS = (
+    "transaction_journal_id",
+    "transaction_group_id",
+    "type",
+    "description",
+    "currency_code",
+    "source_id",
+    "source_name",
+    "destination_id",
+    "destination_name",
+    "category_id",
+    "category_name",
+    "budget_id",
+    "budget_name",
+)
+
+
+def _import(module: str, extra: str) -> Any:
+    """Import an optional dependency of the columnar export."""
+    try:
+        return importlib.import_module(module)
+    except ImportError as err:
+        msg = f"{module} is required for this export, install it with: pip install pyfirefly[{extra}]"
+        raise ImportError(msg) from err
+
+
+class TransactionColumns:
+    """Column arrays of transaction splits, built without a Python object per split.
+
+    Splits are appended as the plain JSON decoded dictionaries of the Firefly API,
+    for example, from `Firefly.iter_transaction_splits`. Numeric columns are kept
+    in compact `array.array` buffers:
+
+    - `amount`: the amount as a float, NaN when missing.
+    - `amount_minor`: the amount in minor units (for example, cents), scaled by
+      the `currency_decimal_places` of the split, 0 when missing.
+    - `currency_decimal_places`: the decimal places of the currency of the split.
+    - `date`: the date in microseconds since the epoch (UTC), `MISSING_DATE` when missing.
+
+    The other columns, listed in `STRING_COLUMNS`, are lists of strings. Convert
+    the columns with `to_arrow`, `to_parquet` or `to_numpy`, which need the
+    optional `pyarrow` or `numpy` packages.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty columns."""
+        self.amount = array("d")
+        self.amount_minor = array("q")
+        self.currency_decimal_places = array("h")
+        self.date = array("q")
+        self.strings: dict[str, list[str | None]] = {name: [] for name in STRING_COLUMNS}
+
+    def __len__(self) -> int:
+        """Return the number of splits."""
+        return len(self.date)
+
+    def append(self, split: dict[str, Any]) -> None:
+        """Append a split to the columns.
+
+        Args:
+        ----
+            split: The JSON decoded split.
+
+        """
+        decimal_places = split.get("currency_decimal_places")
+        decimal_places = 2 if decimal_places is None else int(decimal_places)
+        try:
+            amount_minor = int(Decimal(split["amount"]).scaleb(decimal_places).to_integral_value())
+        except (KeyError, TypeError, InvalidOperation):
+            self.amount.append(float("nan"))
+            self.amount_minor.append(0)
+        else:
+            self.amount.append(amount_minor / 10**decimal_places)
+            self.amount_minor.append(amount_minor)
+        self.currency_decimal_places.append(decimal_places)
+
+        self.date.append(self._timestamp(split.get("date")))
+        for name, values in self.strings.items():
+            value = split.get(name)
+            values.append(None if value is None else str(value))
+
+    def extend(self, splits: Iterable[dict[str, Any]]) -> None:
+        """Append multiple splits to the columns.
+
+        Args:
+        ----
+            splits: The JSON decoded splits.
+
+        """
+        for split in splits:
+            self.append(split)
+
+    @staticmethod
+    def _timestamp(value: str | None) -> int:
+        """Convert an ISO 8601 date to microseconds since the epoch."""
+        if not value:
+            return MISSING_DATE
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return MISSING_DATE
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=UTC)
+        return (parsed - EPOCH) // timedelta(microseconds=1)
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Convert the columns to NumPy arrays.
+
+        Returns
+        -------
+            A dictionary of NumPy arrays by column name. Dates are `datetime64[us]`
+            arrays in UTC, with NaT for missing dates, and strings are object arrays.
+
+        """
+        np = _import("numpy", "numpy")
+        return {
+            "date": np.frombuffer(self.date, dtype=np.int64).copy().view("datetime64[us]"),
+            "amount": np.frombuffer(self.amount, dtype=np.float64).copy(),
+            "amount_minor": np.frombuffer(self.amount_minor, dtype=np.int64).copy(),
+            "currency_decimal_places": np.frombuffer(self.currency_decimal_places, dtype=np.int16).copy(),
+            **{name: np.array(values, dtype=object) for name, values in self.strings.items()},
+        }
+
+    def to_arrow(self) -> Any:
+        """Convert the columns to an Arrow table.
+
+        Returns
+        -------
+            A `pyarrow.Table`, with missing amounts and dates as nulls.
+
+        """
+        pa = _import("pyarrow", "arrow")
+        pc = _import("pyarrow.compute", "arrow")
+
+        def from_buffer(data_type: Any, values: array[Any]) -> Any:
+            return pa.Array.from_buffers(data_type, len(values), [None, pa.py_buffer(values.tobytes())])
+
+        date = from_buffer(pa.int64(), self.date)
+        date = pc.if_else(pc.equal(date, MISSING_DATE), pa.scalar(None, pa.int64()), date)
+        amount = from_buffer(pa.float64(), self.amount)
+        amount = pc.if_else(pc.is_nan(amount), pa.scalar(None, pa.float64()), amount)
+        return pa.table(
+            {
+                "date": date.cast(pa.timestamp("us", tz="UTC")),
+                "amount": amount,
+                "amount_minor": from_buffer(pa.int64(), self.amount_minor),
+                "currency_decimal_places": from_buffer(pa.int16(), self.currency_decimal_places),
+                **{name: pa.array(values, type=pa.string()) for name, values in self.strings.items()},
+            }
+        )
+
+    def to_parquet(self, path: str | Path) -> None:
+        """Write the columns to a Parquet file.
+
+        Args:
+        ----
+            path: Path of the Parquet file.
+
+        """
+        _import("pyarrow.parquet", "arrow").write_table(self.to_arrow(), path)
+
+    def to_columns(self) -> Any:
+        """Convert the columns to an Arrow table if pyarrow is installed, else to NumPy arrays.
+
+        Returns
+        -------
+            A `pyarrow.Table`, or a dictionary of NumPy arrays by column name.
+
+        """
+        try:
+            return self.to_arrow()
+        except ImportError:
+            return self.to_numpy()
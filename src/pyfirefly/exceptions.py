@@ -19,3 +19,11 @@ class FireflyAuthenticationError(FireflyError):
 
 class FireflyNotFoundError(FireflyError):
     """Exception raised when a resource is not found."""
+
+
+class FireflyPaginationError(FireflyError):
+    """Exception raised when a paginated response is inconsistent."""
+
+
+class FireflyValidationError(FireflyError):
+    """Exception raised when the server rejects a request as invalid."""
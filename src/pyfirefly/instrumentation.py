@@ -0,0 +1,290 @@
+"""Instrumentation of the requests of the Firefly API client."""
+
+from __future__ import annotations
+
+import importlib
+import re
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import TraceConfig
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+    from aiohttp import (
+        ClientSession,
+        TraceConnectionCreateEndParams,
+        TraceConnectionCreateStartParams,
+        TraceDnsResolveHostEndParams,
+        TraceDnsResolveHostStartParams,
+        TraceRequestEndParams,
+        TraceRequestStartParams,
+    )
+
+# Upper bounds (in seconds) of the buckets of latency histograms
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_ID_SEGMENT = re.compile(r"(?<=/)\d+(?=/|$)")
+
+
+def endpoint_name(uri: str) -> str:
+    """Get the endpoint of a request URI, with IDs replaced by a placeholder.
+
+    Args:
+    ----
+        uri: Request URI, for example, 'accounts/2/transactions'.
+
+    Returns:
+    -------
+        The endpoint, for example, 'accounts/{id}/transactions'.
+
+    """
+    return _ID_SEGMENT.sub("{id}", uri)
+
+
+@dataclass(slots=True)
+class RequestInfo:
+    """Information about a finished request to the Firefly API."""
+
+    method: str
+    endpoint: str
+    seconds: float = 0.0
+    size: int = 0
+    decode_seconds: float = 0.0
+    error: BaseException | None = None
+
+
+class Instrumentation:
+    """Hooks called around the requests of the Firefly client.
+
+    Subclass this class and override the hooks to observe requests. The hooks
+    run on the event loop, so keep them fast. A client without instrumentation
+    skips all of this.
+    """
+
+    def request_start(self, method: str, endpoint: str) -> Any:
+        """Handle the start of a request, before it is sent.
+
+        Args:
+        ----
+            method: HTTP method of the request.
+            endpoint: The endpoint of the request, see `endpoint_name`.
+
+        Returns:
+        -------
+            A value that is passed to `request_end` of the same request.
+
+        """
+
+    def request_end(self, token: Any, info: RequestInfo) -> None:
+        """Handle the end of a request, after the response was decoded or the request failed.
+
+        Args:
+        ----
+            token: The value returned by `request_start`.
+            info: Information about the request.
+
+        """
+
+    def paginated(self, endpoint: str, pages: int) -> None:
+        """Handle the end of a walk over the pages of a paginated endpoint.
+
+        Args:
+        ----
+            endpoint: The paginated endpoint.
+            pages: Number of pages that were walked.
+
+        """
+
+    def trace_config(self) -> TraceConfig | None:
+        """Get an aiohttp trace config to add to the session created by the client.
+
+        Returns
+        -------
+            The trace config, or None to not trace the session.
+
+        """
+        return None
+
+
+@dataclass
+class Histogram:
+    """Histogram of observed values, with fixed bucket upper bounds."""
+
+    bounds: tuple[float, ...] = LATENCY_BUCKETS
+    counts: list[int] = field(init=False)
+    count: int = 0
+    total: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Initialize the bucket counts, with an extra bucket for values above the last bound."""
+        self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        """Add an observed value to the histogram."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the observed values."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, quantile: float) -> float:
+        """Estimate a quantile, as the upper bound of the bucket that contains it.
+
+        Args:
+        ----
+            quantile: The quantile, between 0 and 1, for example, 0.99.
+
+        Returns:
+        -------
+            The upper bound of the bucket, infinity for values above the last bound.
+
+        """
+        rank = quantile * self.count
+        seen = 0
+        for bound, count in zip((*self.bounds, float("inf")), self.counts, strict=True):
+            seen += count
+            if seen >= rank and seen:
+                return bound
+        return 0.0
+
+
+@dataclass
+class EndpointMetrics:
+    """Metrics of the requests to a single endpoint."""
+
+    requests: int = 0
+    errors: int = 0
+    received_bytes: int = 0
+    latency: Histogram = field(default_factory=Histogram)
+    decode: Histogram = field(default_factory=Histogram)
+    list_calls: int = 0
+    pages: int = 0
+
+
+class FireflyMetrics(Instrumentation):
+    """Collect latency histograms, transferred bytes and page counts per endpoint.
+
+    The latency of a request covers sending it, including retries, and reading
+    the response body. The time spent decoding the response is kept apart. The
+    trace config of the metrics adds the time spent on DNS resolution, creating
+    connections and waiting for response headers (server time) of all requests.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self.dns = Histogram()
+        self.connect = Histogram()
+        self.server = Histogram()
+
+    def _endpoint(self, endpoint: str) -> EndpointMetrics:
+        """Get the metrics of an endpoint, creating them if needed."""
+        metrics = self.endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics()
+        return metrics
+
+    def request_end(self, token: Any, info: RequestInfo) -> None:  # noqa: ARG002
+        """Record a finished request."""
+        metrics = self._endpoint(info.endpoint)
+        metrics.requests += 1
+        if info.error is not None:
+            metrics.errors += 1
+            return
+        metrics.received_bytes += info.size
+        metrics.latency.observe(info.seconds)
+        metrics.decode.observe(info.decode_seconds)
+
+    def paginated(self, endpoint: str, pages: int) -> None:
+        """Record a walk over the pages of a paginated endpoint."""
+        metrics = self._endpoint(endpoint)
+        metrics.list_calls += 1
+        metrics.pages += pages
+
+    def trace_config(self) -> TraceConfig:
+        """Get an aiohttp trace config that records DNS, connect and server time.
+
+        Add it to the `trace_configs` of your own session, if you pass a session
+        to the client.
+
+        Returns
+        -------
+            The trace config.
+
+        """
+
+        async def on_dns_start(_: ClientSession, context: SimpleNamespace, __: TraceDnsResolveHostStartParams) -> None:
+            context.dns_started_at = time.perf_counter()
+
+        async def on_dns_end(_: ClientSession, context: SimpleNamespace, __: TraceDnsResolveHostEndParams) -> None:
+            self.dns.observe(time.perf_counter() - context.dns_started_at)
+
+        async def on_connect_start(_: ClientSession, context: SimpleNamespace, __: TraceConnectionCreateStartParams) -> None:
+            context.connect_started_at = time.perf_counter()
+
+        async def on_connect_end(_: ClientSession, context: SimpleNamespace, __: TraceConnectionCreateEndParams) -> None:
+            self.connect.observe(time.perf_counter() - context.connect_started_at)
+
+        async def on_request_start(_: ClientSession, context: SimpleNamespace, __: TraceRequestStartParams) -> None:
+            context.request_started_at = time.perf_counter()
+
+        async def on_request_end(_: ClientSession, context: SimpleNamespace, __: TraceRequestEndParams) -> None:
+            self.server.observe(time.perf_counter() - context.request_started_at)
+
+        config = TraceConfig()
+        config.on_dns_resolvehost_start.append(on_dns_start)
+        config.on_dns_resolvehost_end.append(on_dns_end)
+        config.on_connection_create_start.append(on_connect_start)
+        config.on_connection_create_end.append(on_connect_end)
+        config.on_request_start.append(on_request_start)
+        config.on_request_end.append(on_request_end)
+        return config
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Create an OpenTelemetry span for every request.
+
+    Requires the optional `opentelemetry-api` package, which can be installed
+    with: pip install pyfirefly[opentelemetry]
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        """Initialize the instrumentation.
+
+        Args:
+        ----
+            tracer: The OpenTelemetry tracer to create spans with. Defaults to
+                the tracer named "pyfirefly" of the global tracer provider.
+
+        """
+        try:
+            self._trace = importlib.import_module("opentelemetry.trace")
+        except ImportError as err:
+            msg = "opentelemetry-api is required for spans, install it with: pip install pyfirefly[opentelemetry]"
+            raise ImportError(msg) from err
+        self._tracer = tracer or self._trace.get_tracer("pyfirefly")
+
+    def request_start(self, method: str, endpoint: str) -> Any:
+        """Start the span of a request."""
+        return self._tracer.start_span(
+            f"Firefly {method} {endpoint}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={"http.request.method": method, "firefly.endpoint": endpoint},
+        )
+
+    def request_end(self, token: Any, info: RequestInfo) -> None:
+        """End the span of a request."""
+        if info.error is not None:
+            token.record_exception(info.error)
+            token.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(info.error)))
+        else:
+            token.set_attribute("http.response.body.size", info.size)
+            token.set_attribute("firefly.decode_seconds", info.decode_seconds)
+        token.end()
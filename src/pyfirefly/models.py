@@ -2,12 +2,136 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass, field, fields, make_dataclass
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import TYPE_CHECKING, Any, Generic, Self, TypeVar, cast, get_type_hints, overload
 
 from mashumaro import field_options
+from mashumaro.config import BaseConfig
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+ResourceT = TypeVar("ResourceT")
+ModelT = TypeVar("ModelT", bound=DataClassORJSONMixin)
+ValueT = TypeVar("ValueT")
+
+
+class LazyValue(Generic[ValueT]):  # pylint: disable=too-few-public-methods
+    """Typed value of a model field, parsed on first access and cached on the instance.
+
+    Unlike the fields, lazy values are not part of the (de)serialized model, and
+    fields that are never read through a lazy value are never parsed. The cached
+    value is not updated when the field changes, so treat models as read-only.
+    """
+
+    def __init__(self, parse: Callable[[Any], ValueT | None]) -> None:
+        """Initialize the lazy value.
+
+        Args:
+        ----
+            parse: Callable that parses the value from the model instance.
+
+        """
+        self._parse = parse
+        self._name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Remember the attribute name to cache the parsed value under."""
+        self._name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> Self: ...
+
+    @overload
+    def __get__(self, instance: object, owner: type) -> ValueT | None: ...
+
+    def __get__(self, instance: object | None, owner: type) -> Self | ValueT | None:
+        """Parse the value and cache it on the instance, which shadows this descriptor."""
+        if instance is None:
+            return self
+        value = self._parse(instance)
+        instance.__dict__[self._name] = value
+        return value
+
+
+def _parse_decimal(value: str | None) -> Decimal | None:
+    """Parse a money string into a Decimal, or None if missing or invalid."""
+    if value is None:
+        return None
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        return None
+
+
+def decimal_value(name: str) -> LazyValue[Decimal]:
+    """Create a lazy Decimal of a money field.
+
+    Args:
+    ----
+        name: Name of the money field, for example, "amount".
+
+    Returns:
+    -------
+        The lazy value, None if the field is missing or invalid.
+
+    """
+    return LazyValue(lambda instance: _parse_decimal(getattr(instance, name)))
+
+
+def minor_units_value(name: str, decimal_places: str = "currency_decimal_places") -> LazyValue[int]:
+    """Create a lazy amount in minor units (for example, cents) of a money field.
+
+    Args:
+    ----
+        name: Name of the money field, for example, "amount".
+        decimal_places: Name of the field with the decimal places of the currency.
+            Amounts are scaled by 2 decimal places if it is missing.
+
+    Returns:
+    -------
+        The lazy value, None if the field is missing or invalid.
+
+    """
+
+    def parse(instance: Any) -> int | None:
+        amount = _parse_decimal(getattr(instance, name))
+        if amount is None:
+            return None
+        places = getattr(instance, decimal_places)
+        return int(amount.scaleb(2 if places is None else places).to_integral_value())
+
+    return LazyValue(parse)
+
+
+def datetime_value(name: str) -> LazyValue[datetime]:
+    """Create a lazy datetime of an ISO 8601 date field.
+
+    Args:
+    ----
+        name: Name of the date field, for example, "created_at".
+
+    Returns:
+    -------
+        The lazy value, None if the field is missing or invalid. Dates without
+        a time zone, like "2025-01-31", result in a naive datetime.
+
+    """
+
+    def parse(instance: Any) -> datetime | None:
+        value = getattr(instance, name)
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+
+    return LazyValue(parse)
+
 
 @dataclass
 class About(DataClassORJSONMixin):
@@ -77,6 +201,26 @@ class AccountAttributes(DataClassORJSONMixin):  # pylint: disable=too-many-insta
     zoom_level: int | None = None
     last_activity: str | None = None
 
+    created_at_datetime = datetime_value("created_at")
+    updated_at_datetime = datetime_value("updated_at")
+    current_balance_date_datetime = datetime_value("current_balance_date")
+    opening_balance_date_datetime = datetime_value("opening_balance_date")
+    monthly_payment_date_datetime = datetime_value("monthly_payment_date")
+    current_balance_decimal = decimal_value("current_balance")
+    current_balance_minor = minor_units_value("current_balance")
+    native_current_balance_decimal = decimal_value("native_current_balance")
+    native_current_balance_minor = minor_units_value("native_current_balance", "native_currency_decimal_places")
+    virtual_balance_decimal = decimal_value("virtual_balance")
+    virtual_balance_minor = minor_units_value("virtual_balance")
+    native_virtual_balance_decimal = decimal_value("native_virtual_balance")
+    native_virtual_balance_minor = minor_units_value("native_virtual_balance", "native_currency_decimal_places")
+    opening_balance_decimal = decimal_value("opening_balance")
+    opening_balance_minor = minor_units_value("opening_balance")
+    native_opening_balance_decimal = decimal_value("native_opening_balance")
+    native_opening_balance_minor = minor_units_value("native_opening_balance", "native_currency_decimal_places")
+    current_debt_decimal = decimal_value("current_debt")
+    current_debt_minor = minor_units_value("current_debt")
+
 
 @dataclass
 class Account(DataClassORJSONMixin):
@@ -153,6 +297,18 @@ class Transaction(DataClassORJSONMixin):  # pylint: disable=too-many-instance-at
     zoom_level: int | None = None
     has_attachments: bool | None = None
 
+    date_datetime = datetime_value("date")
+    interest_date_datetime = datetime_value("interest_date")
+    book_date_datetime = datetime_value("book_date")
+    process_date_datetime = datetime_value("process_date")
+    due_date_datetime = datetime_value("due_date")
+    payment_date_datetime = datetime_value("payment_date")
+    invoice_date_datetime = datetime_value("invoice_date")
+    amount_decimal = decimal_value("amount")
+    amount_minor = minor_units_value("amount")
+    foreign_amount_decimal = decimal_value("foreign_amount")
+    foreign_amount_minor = minor_units_value("foreign_amount", "foreign_currency_decimal_places")
+
 
 @dataclass
 class TransactionAttributes(DataClassORJSONMixin):
@@ -164,6 +320,9 @@ class TransactionAttributes(DataClassORJSONMixin):
     group_title: str | None = None
     transactions: list[Transaction] | None = None
 
+    created_at_datetime = datetime_value("created_at")
+    updated_at_datetime = datetime_value("updated_at")
+
 
 @dataclass
 class TransactionResource(DataClassORJSONMixin):
@@ -185,6 +344,9 @@ class CategoryAmount(DataClassORJSONMixin):
     currency_decimal_places: int | None = None
     sum: str | None = None
 
+    sum_decimal = decimal_value("sum")
+    sum_minor = minor_units_value("sum")
+
 
 @dataclass
 class CategoryAttributes(DataClassORJSONMixin):
@@ -201,6 +363,9 @@ class CategoryAttributes(DataClassORJSONMixin):
     spent: list[CategoryAmount] | None = None
     earned: list[CategoryAmount] | None = None
 
+    created_at_datetime = datetime_value("created_at")
+    updated_at_datetime = datetime_value("updated_at")
+
 
 @dataclass
 class Category(DataClassORJSONMixin):
@@ -221,6 +386,9 @@ class BudgetSpent(DataClassORJSONMixin):
     currency_symbol: str | None = None
     currency_decimal_places: int | None = None
 
+    sum_decimal = decimal_value("sum")
+    sum_minor = minor_units_value("sum")
+
 
 @dataclass
 class BudgetAttributes(DataClassORJSONMixin):
@@ -246,6 +414,13 @@ class BudgetAttributes(DataClassORJSONMixin):
     auto_budget_period: str | None = None
     spent: list[BudgetSpent] | None = None
 
+    created_at_datetime = datetime_value("created_at")
+    updated_at_datetime = datetime_value("updated_at")
+    auto_budget_amount_decimal = decimal_value("auto_budget_amount")
+    auto_budget_amount_minor = minor_units_value("auto_budget_amount")
+    native_auto_budget_amount_decimal = decimal_value("native_auto_budget_amount")
+    native_auto_budget_amount_minor = minor_units_value("native_auto_budget_amount", "native_currency_decimal_places")
+
 
 @dataclass
 class Budget(DataClassORJSONMixin):
@@ -287,6 +462,29 @@ class BudgetLimitAttributes(DataClassORJSONMixin):  # pylint: disable=too-many-i
     pc_spent: list[BudgetSpent] | None = None
     notes: str | None = None
 
+    created_at_datetime = datetime_value("created_at")
+    updated_at_datetime = datetime_value("updated_at")
+    start_datetime = datetime_value("start")
+    end_datetime = datetime_value("end")
+    start_date_datetime = datetime_value("start_date")
+    end_date_datetime = datetime_value("end_date")
+    amount_decimal = decimal_value("amount")
+    amount_minor = minor_units_value("amount")
+    pc_amount_decimal = decimal_value("pc_amount")
+    pc_amount_minor = minor_units_value("pc_amount", "primary_currency_decimal_places")
+    # The native amount is the amount in the primary currency of older Firefly versions
+    native_amount_decimal = decimal_value("native_amount")
+    native_amount_minor = minor_units_value("native_amount", "primary_currency_decimal_places")
+
+
+@dataclass
+class BudgetLimit(DataClassORJSONMixin):
+    """Model for a Firefly budget limit."""
+
+    type: str
+    id: str
+    attributes: BudgetLimitAttributes
+
 
 @dataclass
 class BillPaidDate(DataClassORJSONMixin):
@@ -296,6 +494,8 @@ class BillPaidDate(DataClassORJSONMixin):
     transaction_journal_id: str | None = None
     date: str | None = None
 
+    date_datetime = datetime_value("date")
+
 
 @dataclass
 class BillAttributes(DataClassORJSONMixin):  # pylint: disable=too-many-instance-attributes
@@ -332,6 +532,21 @@ class BillAttributes(DataClassORJSONMixin):  # pylint: disable=too-many-instance
     pay_dates: list[str] | None = None
     paid_dates: list[BillPaidDate] | None = None
 
+    created_at_datetime = datetime_value("created_at")
+    updated_at_datetime = datetime_value("updated_at")
+    date_datetime = datetime_value("date")
+    end_date_datetime = datetime_value("end_date")
+    extension_date_datetime = datetime_value("extension_date")
+    next_expected_match_datetime = datetime_value("next_expected_match")
+    amount_min_decimal = decimal_value("amount_min")
+    amount_min_minor = minor_units_value("amount_min")
+    amount_max_decimal = decimal_value("amount_max")
+    amount_max_minor = minor_units_value("amount_max")
+    native_amount_min_decimal = decimal_value("native_amount_min")
+    native_amount_min_minor = minor_units_value("native_amount_min", "native_currency_decimal_places")
+    native_amount_max_decimal = decimal_value("native_amount_max")
+    native_amount_max_minor = minor_units_value("native_amount_max", "native_currency_decimal_places")
+
 
 @dataclass
 class Bill(DataClassORJSONMixin):
@@ -360,6 +575,9 @@ class PreferencesAttributes(DataClassORJSONMixin):
     name: str | None = None
     data: str | bool | None = None
 
+    created_at_datetime = datetime_value("created_at")
+    updated_at_datetime = datetime_value("updated_at")
+
 
 @dataclass
 class Currency(DataClassORJSONMixin):
@@ -383,3 +601,288 @@ class CurrencyAttributes(DataClassORJSONMixin):
     name: str | None = None
     symbol: str | None = None
     decimal_places: int | None = None
+
+    created_at_datetime = datetime_value("created_at")
+    updated_at_datetime = datetime_value("updated_at")
+
+
+@dataclass
+class BasicSummaryEntry(DataClassORJSONMixin):
+    """Model for an entry of the Firefly basic summary, for example, the balance in a currency."""
+
+    key: str | None = None
+    title: str | None = None
+    monetary_value: float | None = None
+    currency_id: str | None = None
+    currency_code: str | None = None
+    currency_symbol: str | None = None
+    currency_decimal_places: int | None = None
+    no_available_budgets: bool | None = None
+    value_parsed: str | None = None
+    local_icon: str | None = None
+    sub_title: str | None = None
+
+
+@dataclass
+class InsightEntry(DataClassORJSONMixin):
+    """Model for an entry of a Firefly insight, the total of a group in a currency.
+
+    Totals over all groups have no ID and name.
+    """
+
+    id: str | None = None
+    name: str | None = None
+    difference: str | None = None
+    difference_float: float | None = None
+    currency_id: str | None = None
+    currency_code: str | None = None
+
+    difference_decimal = decimal_value("difference")
+
+
+@dataclass
+class ChartDataSet(DataClassORJSONMixin):  # pylint: disable=too-many-instance-attributes
+    """Model for a data set of a Firefly chart, for example, the balance of an account over time."""
+
+    label: str | None = None
+    currency_id: str | None = None
+    currency_code: str | None = None
+    currency_symbol: str | None = None
+    currency_decimal_places: int | None = None
+    start_date: str | None = None
+    end_date: str | None = None
+    type: str | None = None
+    period: str | None = None
+    y_axis_id: int | None = field(default=None, metadata=field_options(alias="yAxisID"))
+    entries: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Pagination(DataClassORJSONMixin):
+    """Model for the pagination information of a Firefly list response."""
+
+    total: int | None = None
+    count: int | None = None
+    per_page: int | None = None
+    current_page: int | None = None
+    total_pages: int | None = None
+
+
+@dataclass
+class PageMeta(DataClassORJSONMixin):
+    """Model for the meta information of a Firefly list response."""
+
+    pagination: Pagination = field(default_factory=Pagination)
+
+
+@dataclass
+class Page(DataClassORJSONMixin, Generic[ResourceT]):
+    """Model for a single page of a Firefly list response."""
+
+    data: list[ResourceT]
+    meta: PageMeta = field(default_factory=PageMeta)
+
+
+@dataclass
+class RawPage(Page[dict[str, Any]]):
+    """Model for a page of plain JSON decoded Firefly resources."""
+
+
+@dataclass
+class AccountPage(Page[Account]):
+    """Model for a page of Firefly accounts."""
+
+
+@dataclass
+class TransactionPage(Page[TransactionResource]):
+    """Model for a page of Firefly transactions."""
+
+
+@dataclass
+class CategoryPage(Page[Category]):
+    """Model for a page of Firefly categories."""
+
+
+@dataclass
+class BillPage(Page[Bill]):
+    """Model for a page of Firefly bills."""
+
+
+@dataclass
+class BudgetPage(Page[Budget]):
+    """Model for a page of Firefly budgets."""
+
+
+@dataclass
+class BudgetLimitPage(Page[BudgetLimit]):
+    """Model for a page of Firefly budget limits."""
+
+
+@dataclass
+class SyncedTransaction(DataClassORJSONMixin):
+    """Model for the state of a transaction group seen by an incremental sync."""
+
+    updated_at: str | None = None
+    date: str | None = None
+
+
+@dataclass
+class TransactionSyncCursor(DataClassORJSONMixin):
+    """Model for the cursor of an incremental transaction sync.
+
+    Persist the cursor between syncs, for example, with `to_json` and `from_json`.
+    """
+
+    account_id: int | None = None
+    watermark: str | None = None
+    last_updated_at: str | None = None
+    seen: dict[str, SyncedTransaction] = field(default_factory=dict)
+
+
+@dataclass
+class TransactionSyncResult(DataClassORJSONMixin):
+    """Model for the changes found by an incremental transaction sync."""
+
+    cursor: TransactionSyncCursor
+    added: list[TransactionResource] = field(default_factory=list)
+    updated: list[TransactionResource] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+
+
+@dataclass
+class TransactionSplitStore(DataClassORJSONMixin):  # pylint: disable=too-many-instance-attributes
+    """Model for a split of a Firefly transaction to create."""
+
+    type: str
+    date: str
+    amount: str
+    description: str
+    order: int | None = None
+    currency_id: str | None = None
+    currency_code: str | None = None
+    foreign_amount: str | None = None
+    foreign_currency_id: str | None = None
+    foreign_currency_code: str | None = None
+    budget_id: str | None = None
+    budget_name: str | None = None
+    category_id: str | None = None
+    category_name: str | None = None
+    source_id: str | None = None
+    source_name: str | None = None
+    destination_id: str | None = None
+    destination_name: str | None = None
+    reconciled: bool | None = None
+    piggy_bank_id: int | None = None
+    piggy_bank_name: str | None = None
+    bill_id: str | None = None
+    bill_name: str | None = None
+    tags: list[str] | None = None
+    notes: str | None = None
+    internal_reference: str | None = None
+    external_id: str | None = None
+    external_url: str | None = None
+    interest_date: str | None = None
+    book_date: str | None = None
+    process_date: str | None = None
+    due_date: str | None = None
+    payment_date: str | None = None
+    invoice_date: str | None = None
+
+    class Config(BaseConfig):  # pylint: disable=too-few-public-methods
+        """Leave out unset fields, so the server applies its defaults."""
+
+        omit_none = True
+
+
+@dataclass
+class TransactionStore(DataClassORJSONMixin):
+    """Model for a Firefly transaction to create, with one or more splits."""
+
+    transactions: list[TransactionSplitStore]
+    group_title: str | None = None
+    error_if_duplicate_hash: bool | None = None
+    apply_rules: bool | None = None
+    fire_webhooks: bool | None = None
+
+    class Config(BaseConfig):  # pylint: disable=too-few-public-methods
+        """Leave out unset fields, so the server applies its defaults."""
+
+        omit_none = True
+
+
+@dataclass
+class TransactionBulkResult:
+    """Result of creating transactions in bulk.
+
+    Every transaction to create ends up in exactly one of the lists.
+    """
+
+    created: list[TransactionResource] = field(default_factory=list)
+    duplicates: list[TransactionStore] = field(default_factory=list)
+    errors: list[tuple[TransactionStore, Exception]] = field(default_factory=list)
+
+
+# Compact models by model and field names, see `compact_model`
+_COMPACT_MODELS: dict[tuple[type[DataClassORJSONMixin], tuple[str, ...] | None], type[DataClassORJSONMixin]] = {}
+
+
+def compact_model(model: type[ModelT], names: tuple[str, ...] | None = None) -> type[ModelT]:
+    """Create a compact variant of a model, with slots and optionally a subset of its fields.
+
+    Instances of the compact model have no `__dict__`, which saves a lot of memory
+    on wide models like `Transaction`, and only the selected fields are decoded.
+    Compact models are created once and reused for the same model and fields.
+
+    The compact model is not a subclass of the model, but is typed as the model
+    so its fields can be accessed with their types. Only the selected fields
+    exist on its instances, and the typed value accessors of the model do not.
+
+    Args:
+    ----
+        model: The model to create a compact variant of, for example, `Transaction`.
+        names: The names of the fields to keep, in order. Defaults to all fields.
+
+    Returns:
+    -------
+        A slotted model class, named after the model with a "Compact" prefix.
+
+    Raises:
+    ------
+        ValueError: If a field name is not a field of the model.
+
+    """
+    compact = _COMPACT_MODELS.get((model, names))
+    if compact is None:
+        compact = _COMPACT_MODELS[model, names] = _compact_model(model, names)
+    return cast("type[ModelT]", compact)
+
+
+def _compact_model(model: type[DataClassORJSONMixin], names: tuple[str, ...] | None) -> type[DataClassORJSONMixin]:
+    """Create a compact variant of a model, see `compact_model`."""
+    model_fields = {model_field.name: model_field for model_field in fields(model)}  # type: ignore[arg-type]
+    names = names if names is not None else tuple(model_fields)
+    if unknown := [name for name in names if name not in model_fields]:
+        msg = f"Unknown fields for {model.__name__}: {', '.join(unknown)}"
+        raise ValueError(msg)
+
+    hints = get_type_hints(model)
+    compact: type[DataClassORJSONMixin] = make_dataclass(
+        f"Compact{model.__name__}",
+        [
+            (
+                name,
+                hints[name],
+                field(
+                    default=model_fields[name].default,
+                    default_factory=model_fields[name].default_factory,
+                    metadata=model_fields[name].metadata,
+                ),
+            )
+            for name in names
+        ],
+        bases=(DataClassORJSONMixin,),
+        kw_only=True,
+        slots=True,
+    )
+    compact.__module__ = __name__
+    return compact
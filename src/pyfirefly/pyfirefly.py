@@ -3,35 +3,77 @@
 from __future__ import annotations
 
 import asyncio
+import random
 import socket
-from dataclasses import dataclass
-from datetime import datetime
+import ssl
+import time
+from collections import OrderedDict, deque
+from contextlib import nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from datetime import UTC, date, datetime, timedelta
+from email.utils import parsedate_to_datetime
 from importlib import metadata
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Literal, Self, TypeVar
 from urllib.parse import urlparse
 
-from aiohttp import ClientError, ClientResponseError, ClientSession
-from aiohttp.hdrs import METH_GET
+import orjson
+from aiohttp import ClientError, ClientResponse, ClientResponseError, ClientSession, TCPConnector
+from aiohttp.hdrs import ETAG, IF_MODIFIED_SINCE, IF_NONE_MATCH, LAST_MODIFIED, METH_GET, METH_POST, RETRY_AFTER
 from yarl import URL
 
+from pyfirefly.columnar import TransactionColumns
 from pyfirefly.exceptions import (
     FireflyAuthenticationError,
     FireflyConnectionError,
     FireflyError,
     FireflyNotFoundError,
+    FireflyPaginationError,
     FireflyTimeoutError,
+    FireflyValidationError,
 )
+from pyfirefly.instrumentation import Instrumentation, RequestInfo, endpoint_name
 from pyfirefly.models import (
     About,
-    Account,
-    Bill,
+    AccountPage,
+    BasicSummaryEntry,
+    BillPage,
     Budget,
+    BudgetLimit,
     BudgetLimitAttributes,
+    BudgetLimitPage,
+    BudgetPage,
     Category,
+    CategoryPage,
+    ChartDataSet,
     Currency,
+    InsightEntry,
+    Page,
     Preferences,
+    RawPage,
+    SyncedTransaction,
     Transaction,
+    TransactionBulkResult,
+    TransactionPage,
+    TransactionResource,
+    TransactionSyncCursor,
+    TransactionSyncResult,
+    compact_model,
 )
+from pyfirefly.ratelimit import RateLimiter
+from pyfirefly.tuning import PageSizeTuner
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Iterable, Sequence
+
+    from pyfirefly.cache import ResponseCache
+    from pyfirefly.models import Account, Bill, TransactionStore
+
+PageT = TypeVar("PageT", bound=Page[Any])
+T = TypeVar("T")
+
+# Maximum number of responses remembered for conditional requests
+MAX_CONDITIONAL_RESPONSES = 256
 
 try:
     VERSION = metadata.version(__package__)
@@ -39,8 +81,103 @@ except metadata.PackageNotFoundError:
     VERSION = "DEV-0.0.0"
 
 
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header, in seconds or as an HTTP date.
+
+    Args:
+        value: The value of the Retry-After header.
+
+    Returns:
+        The number of seconds to wait, or None if the value is missing or invalid.
+
+    """
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def _date_shards(start: date, end: date, shard: Literal["month", "week"]) -> list[tuple[date, date]]:
+    """Split a date range into calendar months or weeks.
+
+    Args:
+        start: The first day of the range.
+        end: The last day of the range.
+        shard: Split the range by "month", or by "week" (Monday to Sunday).
+
+    Returns:
+        The first and last day of each shard, in chronological order.
+
+    """
+    start = start.date() if isinstance(start, datetime) else start
+    end = end.date() if isinstance(end, datetime) else end
+
+    shards: list[tuple[date, date]] = []
+    while start <= end:
+        if shard == "week":
+            shard_end = start + timedelta(days=6 - start.weekday())
+        else:
+            shard_end = (start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+        shards.append((start, min(shard_end, end)))
+        start = shard_end + timedelta(days=1)
+    return shards
+
+
+async def _gather(coroutines: Iterable[Coroutine[Any, Any, T]]) -> list[T]:
+    """Run coroutines concurrently and return their results in order.
+
+    Unlike `asyncio.gather`, the remaining coroutines are cancelled as soon as
+    one of them fails, so no requests are sent for results that are discarded.
+
+    Args:
+        coroutines: The coroutines to run.
+
+    Returns:
+        The results of the coroutines, in the order of the coroutines.
+
+    Raises:
+        Exception: The error of the first coroutine that failed.
+
+    """
+    error: BaseException | None = None
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(coroutine) for coroutine in coroutines]
+    except BaseExceptionGroup as err:
+        # Raise the error itself outside the group, keeping its own cause
+        error = err.exceptions[0]
+    if error is not None:
+        raise error
+    return [task.result() for task in tasks]
+
+
+@dataclass(slots=True)
+class _AttemptTiming:
+    """Time the successful attempt of a request took, without waiting in the client."""
+
+    seconds: float | None = None
+
+
+# Timing of the request made in the current context, set to measure the server cost of a page
+_attempt_timing: ContextVar[_AttemptTiming | None] = ContextVar("attempt_timing", default=None)
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """Response body remembered together with its cache validators."""
+
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+
+
 @dataclass
-class Firefly:
+class Firefly:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """Main class for handling connections with the Python Firefly API."""
 
     request_timeout: float = 10.0
@@ -48,13 +185,31 @@ class Firefly:
 
     _close_session: bool = False
 
-    def __init__(
+    def __init__(  # noqa: PLR0913  # pylint: disable=too-many-arguments,too-many-locals
         self,
         api_url: str,
         api_key: str,
         *,
         request_timeout: float = 10.0,
         session: ClientSession | None = None,
+        max_concurrent_pages: int = 4,
+        max_pages: int = 10_000,
+        page_size: int | None = None,
+        adaptive_page_size: bool = False,
+        cache: ResponseCache | None = None,
+        conditional_requests: bool = False,
+        max_retries: int = 0,
+        retry_backoff: float = 0.5,
+        retry_max_delay: float = 30.0,
+        rate_limit: float | None = None,
+        rate_limit_burst: int | None = None,
+        max_in_flight: int | None = None,
+        coalesce_requests: bool = False,
+        instrumentation: Sequence[Instrumentation] = (),
+        connection_limit_per_host: int = 10,
+        keepalive_timeout: float = 60.0,
+        dns_cache_ttl: int | None = 300,
+        ssl_context: ssl.SSLContext | None = None,
     ) -> None:
         """Initialize the Firefly object.
 
@@ -64,11 +219,83 @@ class Firefly:
             api_key: API key for authentication.
             request_timeout: Timeout for requests (in seconds).
             session: Optional aiohttp session to use.
+            max_concurrent_pages: Maximum number of pages fetched concurrently
+                when walking a paginated endpoint.
+            max_pages: Maximum number of pages of a paginated endpoint. Walking
+                an endpoint that reports more pages raises an error instead.
+            page_size: Number of resources per page (the `limit` parameter) of
+                paginated endpoints. Defaults to the page size of the server.
+            adaptive_page_size: Tune the page size of every paginated endpoint from
+                the measured response time and body size of earlier pages, to
+                need fewer requests while staying well within the request timeout.
+            cache: Optional response cache for reference data that rarely
+                changes, such as accounts, categories and currencies.
+            conditional_requests: Remember the ETag and Last-Modified validators
+                of responses and revalidate them with conditional GET requests.
+                Unchanged responses (304 Not Modified) are served from memory.
+            max_retries: Number of times a GET request is retried after a timeout,
+                connection error, server error or rate limiting. Every page of a
+                paginated endpoint is retried on its own.
+            retry_backoff: Base delay (in seconds) of the jittered exponential
+                backoff between retries.
+            retry_max_delay: Maximum delay (in seconds) between retries, also
+                capping the delay asked for by a Retry-After header.
+            rate_limit: Maximum number of requests per second, shared by all
+                callers of this client, including retries and concurrent pages.
+            rate_limit_burst: Maximum number of requests sent at once after an
+                idle period. Defaults to the rate limit.
+            max_in_flight: Maximum number of requests in flight at the same time,
+                shared by all callers of this client.
+            coalesce_requests: Let concurrent identical GET requests (same URI and
+                parameters) share a single request to the Firefly server. The
+                callers then share the returned objects too, so treat them as
+                read-only.
+            instrumentation: Hooks to observe every request, for example,
+                `FireflyMetrics` or `OpenTelemetryInstrumentation`. Their trace
+                configs are added to the session created by the client.
+            connection_limit_per_host: Maximum number of pooled connections to
+                the Firefly server. Only used when no session is passed.
+            keepalive_timeout: Time (in seconds) an idle pooled connection is
+                kept open for reuse. Only used when no session is passed.
+            dns_cache_ttl: Time (in seconds) resolved addresses are cached, or
+                None to disable the DNS cache. Only used when no session is passed.
+            ssl_context: TLS context to use for HTTPS connections. Defaults to a
+                context created once and reused for every connection. Only used
+                when no session is passed.
 
         """
+        if max_concurrent_pages < 1:
+            msg = "max_concurrent_pages must be at least 1"
+            raise ValueError(msg)
+        if max_pages < 1:
+            msg = "max_pages must be at least 1"
+            raise ValueError(msg)
+        if max_in_flight is not None and max_in_flight < 1:
+            msg = "max_in_flight must be at least 1"
+            raise ValueError(msg)
+
         self._api_key = api_key
         self._request_timeout = request_timeout
         self._session = session
+        self._max_concurrent_pages = max_concurrent_pages
+        self._max_pages = max_pages
+        self._page_size = page_size
+        self._page_size_tuner = PageSizeTuner(request_timeout) if adaptive_page_size else None
+        self._cache = cache
+        self._conditional_requests = conditional_requests
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        self._retry_max_delay = retry_max_delay
+        self._rate_limiter = RateLimiter(rate_limit, rate_limit_burst) if rate_limit is not None else None
+        self._in_flight = asyncio.Semaphore(max_in_flight) if max_in_flight is not None else None
+        self._coalesce_requests = coalesce_requests
+        self._instrumentation = tuple(instrumentation)
+        self._pending_requests: dict[tuple[str, Callable[[bytes], Any]], asyncio.Future[Any]] = {}
+        self._connection_limit_per_host = connection_limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
+        self._ssl_context = ssl_context
+        self._conditional_responses: OrderedDict[str, _CachedResponse] = OrderedDict()
 
         parsed_url = urlparse(api_url)
         self._api_host = parsed_url.hostname or "localhost"
@@ -81,6 +308,8 @@ class Firefly:
         *,
         method: str = METH_GET,
         params: dict[str, Any] | None = None,
+        data: bytes | None = None,
+        decoder: Callable[[bytes], Any] = orjson.loads,
     ) -> Any:
         """Handle a request to the Python Firefly API.
 
@@ -89,11 +318,14 @@ class Firefly:
             uri: Request URI, without '/api/', for example, 'status'.
             method: HTTP method to use.
             params: Extra options to improve or limit the response.
+            data: JSON encoded request body to send.
+            decoder: Callable that decodes the raw response body, for example,
+                the `from_json` of a model. Defaults to `orjson.loads`.
 
         Returns:
         -------
-            A Python dictionary (JSON decoded) with the response from
-            the Python Firefly API.
+            The response body from the Python Firefly API, decoded by the
+            decoder. By default, a Python dictionary (JSON decoded).
 
         Raises:
         ------
@@ -107,40 +339,107 @@ class Firefly:
             path="/api/v1/",
         ).join(URL(uri))
 
+        if not self._coalesce_requests or method != METH_GET:
+            return await self._fetch(uri, url, method=method, params=params, data=data, decoder=decoder)
+
+        # Identical GET requests that are in flight share a single request
+        key = (str(url.with_query(params)) if params else str(url), decoder)
+        pending = self._pending_requests.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch(uri, url, method=method, params=params, data=None, decoder=decoder))
+            self._pending_requests[key] = pending
+            pending.add_done_callback(lambda _: self._pending_requests.pop(key, None))
+        return await asyncio.shield(pending)
+
+    async def _fetch(  # noqa: PLR0913  # pylint: disable=too-many-arguments
+        self,
+        uri: str,
+        url: URL,
+        *,
+        method: str,
+        params: dict[str, Any] | None,
+        data: bytes | None,
+        decoder: Callable[[bytes], Any],
+    ) -> Any:
+        """Fetch a URL of the Python Firefly API and decode the response.
+
+        Args:
+        ----
+            uri: Request URI, to report the request to the instrumentation.
+            url: The URL to request.
+            method: HTTP method to use.
+            params: Extra options to improve or limit the response.
+            data: JSON encoded request body to send.
+            decoder: Callable that decodes the raw response body.
+
+        Returns:
+        -------
+            The response body, decoded by the decoder.
+
+        """
+        if not self._instrumentation:
+            return decoder(await self._read(url, method=method, params=params, data=data))
+
+        info = RequestInfo(method=method, endpoint=endpoint_name(uri))
+        tokens = [instrumentation.request_start(method, info.endpoint) for instrumentation in self._instrumentation]
+        started_at = time.perf_counter()
+        try:
+            body = await self._read(url, method=method, params=params, data=data)
+            info.size = len(body)
+            info.seconds = time.perf_counter() - started_at
+            value = decoder(body)
+            info.decode_seconds = time.perf_counter() - started_at - info.seconds
+        except BaseException as err:
+            info.error = err
+            info.seconds = time.perf_counter() - started_at
+            raise
+        finally:
+            for instrumentation, token in zip(self._instrumentation, tokens, strict=True):
+                instrumentation.request_end(token, info)
+        return value
+
+    async def _read(self, url: URL, *, method: str, params: dict[str, Any] | None, data: bytes | None) -> bytes:
+        """Send a request to the Python Firefly API and read the response body.
+
+        Args:
+        ----
+            url: The URL to request.
+            method: HTTP method to use.
+            params: Extra options to improve or limit the response.
+            data: JSON encoded request body to send.
+
+        Returns:
+        -------
+            The response body, or the remembered body if the server responded
+            that it was not modified.
+
+        Raises:
+        ------
+            FireflyError: If the response is not JSON.
+
+        """
         headers = {
             "Accept": "application/json, text/plain",
             "User-Agent": f"PythonFirefly/{VERSION}",
             "Authorization": f"Bearer {self._api_key}",
         }
-
-        if self._session is None:
-            self._session = ClientSession()
-            self._close_session = True
-
-        try:
-            async with asyncio.timeout(self._request_timeout):
-                response = await self._session.request(
-                    method,
-                    url,
-                    headers=headers,
-                    params=params,
-                )
-                response.raise_for_status()
-        except TimeoutError as err:
-            msg = f"Timeout error while accessing {method} {url}: {err}"
-            raise FireflyTimeoutError(msg) from err
-        except ClientResponseError as err:
-            if err.status == 401:
-                msg = f"Authentication failed for {method} {url}: Invalid API key"
-                raise FireflyAuthenticationError(msg) from err
-            if err.status == 404:
-                msg = f"Resource not found at {method} {url}: {err}"
-                raise FireflyNotFoundError(msg) from err
-            msg = f"Connection error for {method} {url}: {err}"
-            raise FireflyConnectionError(msg) from err
-        except (ClientError, socket.gaierror) as err:
-            msg = f"Unexpected error during {method} {url}: {err}"
-            raise FireflyConnectionError(msg) from err
+        if data is not None:
+            headers["Content-Type"] = "application/json"
+
+        conditional_key: str | None = None
+        cached_response: _CachedResponse | None = None
+        if self._conditional_requests and method == METH_GET:
+            conditional_key = str(url.with_query(params)) if params else str(url)
+            # Keep the remembered response, it may be evicted while the request is in flight
+            cached_response = self._conditional_responses.get(conditional_key)
+            if cached_response is not None:
+                headers.update(self._conditional_headers(cached_response))
+
+        response = await self._send(method, url, headers=headers, params=params, data=data)
+        if conditional_key is not None and cached_response is not None and response.status == 304:
+            if conditional_key in self._conditional_responses:
+                self._conditional_responses.move_to_end(conditional_key)
+            return cached_response.body
 
         content_type = response.headers.get("Content-Type", "")
         if "application/json" not in content_type and "application/vnd.api+json" not in content_type:
@@ -151,9 +450,433 @@ class Firefly:
                 {"Content-Type": content_type, "response": text},
             )
 
-        return await response.json()
+        body = await response.read()
+        if conditional_key is not None:
+            self._remember_response(conditional_key, response, body)
+
+        return body
+
+    async def _send(
+        self,
+        method: str,
+        url: URL,
+        *,
+        headers: dict[str, str],
+        params: dict[str, Any] | None,
+        data: bytes | None = None,
+    ) -> ClientResponse:
+        """Send a request to the Python Firefly API, retrying it if allowed.
+
+        Args:
+        ----
+            method: HTTP method to use.
+            url: The URL to send the request to.
+            headers: The headers to send.
+            params: Extra options to improve or limit the response.
+            data: JSON encoded request body to send.
+
+        Returns:
+        -------
+            The response, with a successful status.
+
+        """
+        attempt = 0
+        while True:
+            try:
+                return await self._send_once(method, url, headers=headers, params=params, data=data)
+            except (FireflyTimeoutError, FireflyConnectionError) as err:
+                delay = self._retry_delay(method, attempt, err.__cause__)
+                if delay is None:
+                    raise
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _send_once(
+        self,
+        method: str,
+        url: URL,
+        *,
+        headers: dict[str, str],
+        params: dict[str, Any] | None,
+        data: bytes | None = None,
+    ) -> ClientResponse:
+        """Send a single request to the Python Firefly API, and read its body.
+
+        The request waits for the rate limiter and for a free in-flight slot, if
+        configured. The slot is held until the response body has been read. The
+        time from sending the request until its body has been read is recorded
+        in the attempt timing of the context, if any.
+
+        Args:
+        ----
+            method: HTTP method to use.
+            url: The URL to send the request to.
+            headers: The headers to send.
+            params: Extra options to improve or limit the response.
+            data: JSON encoded request body to send.
+
+        Returns:
+        -------
+            The response, with a successful status.
+
+        Raises:
+        ------
+            FireflyTimeoutError: If the request timed out.
+            FireflyAuthenticationError: If the API key is invalid.
+            FireflyNotFoundError: If the resource does not exist.
+            FireflyValidationError: If the server rejected the request body.
+            FireflyConnectionError: If the request failed otherwise.
+
+        """
+        if self._session is None:
+            self._session = self._create_session()
+            self._close_session = True
+
+        async with self._in_flight or nullcontext():
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+            started_at = time.perf_counter()
+            try:
+                async with asyncio.timeout(self._request_timeout):
+                    response = await self._session.request(
+                        method,
+                        url,
+                        headers=headers,
+                        params=params,
+                        data=data,
+                    )
+                    if response.status == 422:
+                        raise self._validation_error(method, url, await response.read())
+                    response.raise_for_status()
+                    await response.read()
+                    if (timing := _attempt_timing.get()) is not None:
+                        timing.seconds = time.perf_counter() - started_at
+                    return response
+            except TimeoutError as err:
+                msg = f"Timeout error while accessing {method} {url}: {err}"
+                raise FireflyTimeoutError(msg) from err
+            except ClientResponseError as err:
+                if err.status == 401:
+                    msg = f"Authentication failed for {method} {url}: Invalid API key"
+                    raise FireflyAuthenticationError(msg) from err
+                if err.status == 404:
+                    msg = f"Resource not found at {method} {url}: {err}"
+                    raise FireflyNotFoundError(msg) from err
+                msg = f"Connection error for {method} {url}: {err}"
+                raise FireflyConnectionError(msg) from err
+            except (ClientError, socket.gaierror) as err:
+                msg = f"Unexpected error during {method} {url}: {err}"
+                raise FireflyConnectionError(msg) from err
+
+    @staticmethod
+    def _validation_error(method: str, url: URL, body: bytes) -> FireflyValidationError:
+        """Build the error of a request that the server rejected as invalid.
+
+        Args:
+        ----
+            method: HTTP method of the request.
+            url: The URL of the request.
+            body: The response body, with the validation errors per field.
+
+        Returns:
+        -------
+            The FireflyValidationError, with the message and the validation
+            errors per field of the server as details.
+
+        """
+        try:
+            details = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            details = {}
+        if not isinstance(details, dict):
+            details = {}
+        msg = f"Validation failed for {method} {url}: {details.get('message', 'invalid request')}"
+        return FireflyValidationError(msg, {"message": details.get("message"), "errors": details.get("errors") or {}})
+
+    def _create_session(self) -> ClientSession:
+        """Create a client session with a connection pool tuned for the Firefly server.
+
+        Connections are kept alive and reused between requests, resolved addresses
+        are cached, and a single TLS context is shared by all connections, so
+        sustained polling does not pay for a new TCP and TLS handshake per request.
+
+        Returns
+        -------
+            The new client session.
+
+        """
+        if self._ssl_context is None and self._api_scheme == "https":
+            self._ssl_context = ssl.create_default_context()
+
+        connector = TCPConnector(
+            limit_per_host=self._connection_limit_per_host,
+            keepalive_timeout=self._keepalive_timeout,
+            use_dns_cache=self._dns_cache_ttl is not None,
+            ttl_dns_cache=self._dns_cache_ttl,
+            ssl=self._ssl_context or True,
+        )
+        trace_configs = [config for instrumentation in self._instrumentation if (config := instrumentation.trace_config()) is not None]
+        return ClientSession(connector=connector, trace_configs=trace_configs or None)
+
+    def _retry_delay(self, method: str, attempt: int, error: BaseException | None) -> float | None:
+        """Get the delay before retrying a failed request, if it should be retried.
+
+        Only idempotent GET requests are retried, after timeouts, connection errors,
+        server errors and rate limiting. The delay grows exponentially with full
+        jitter, unless the server asks for a specific delay with a Retry-After header.
+
+        Args:
+        ----
+            method: HTTP method of the request.
+            attempt: Number of retries done so far.
+            error: The error the request failed with.
+
+        Returns:
+        -------
+            The delay (in seconds), or None if the request should not be retried.
+
+        """
+        if method != METH_GET or attempt >= self._max_retries:
+            return None
+
+        retry_after: float | None = None
+        if isinstance(error, ClientResponseError):
+            if error.status != 429 and error.status < 500:
+                return None
+            if error.headers is not None:
+                retry_after = _parse_retry_after(error.headers.get(RETRY_AFTER))
+
+        if retry_after is not None:
+            return min(retry_after, self._retry_max_delay)
+        return random.uniform(0, min(self._retry_max_delay, self._retry_backoff * 2**attempt))  # noqa: S311
+
+    @staticmethod
+    def _conditional_headers(cached_response: _CachedResponse) -> dict[str, str]:
+        """Get the conditional request headers for a remembered response.
+
+        Args:
+        ----
+            cached_response: The remembered response to revalidate.
+
+        Returns:
+        -------
+            The If-None-Match and If-Modified-Since headers to send, if any.
+
+        """
+        headers: dict[str, str] = {}
+        if cached_response.etag:
+            headers[IF_NONE_MATCH] = cached_response.etag
+        if cached_response.last_modified:
+            headers[IF_MODIFIED_SINCE] = cached_response.last_modified
+        return headers
+
+    def _remember_response(self, key: str, response: ClientResponse, body: bytes) -> None:
+        """Remember a response body for conditional requests, if it has validators.
+
+        Args:
+        ----
+            key: The URL of the request, including the query string.
+            response: The response to take the validators from.
+            body: The raw body of the response.
+
+        """
+        etag = response.headers.get(ETAG)
+        last_modified = response.headers.get(LAST_MODIFIED)
+        if etag is None and last_modified is None:
+            self._conditional_responses.pop(key, None)
+            return
+
+        self._conditional_responses[key] = _CachedResponse(body=body, etag=etag, last_modified=last_modified)
+        self._conditional_responses.move_to_end(key)
+        while len(self._conditional_responses) > MAX_CONDITIONAL_RESPONSES:
+            self._conditional_responses.popitem(last=False)
+
+    async def _iter_pages(  # pylint: disable=too-many-locals
+        self,
+        uri: str,
+        page_model: type[PageT],
+        params: dict[str, Any] | None = None,
+        limit: int | None = None,
+    ) -> AsyncGenerator[PageT, None]:
+        """Iterate over all pages of a paginated endpoint.
+
+        The first page is requested on its own to learn the total number of pages.
+        The remaining pages are prefetched concurrently in a sliding window of
+        `max_concurrent_pages` requests on the shared client session, and yielded
+        in page order as they arrive. At most one window of pages is held in memory.
+
+        Response bodies are handed straight to the `from_json` decoder of the page
+        model, so each page is decoded into models in a single pass.
+
+        Every page is checked to be the page that was requested and to differ
+        from the previous page, and the number of pages is capped by `max_pages`,
+        so an inconsistent server cannot make the client loop forever.
+
+        Args:
+        ----
+            uri: Request URI, without '/api/', for example, 'accounts'.
+            page_model: The page model to decode every page into.
+            params: Extra options to improve or limit the response.
+            limit: Number of resources per page. Defaults to the tuned page size
+                if adaptive page sizes are enabled, else the page size of the client.
+
+        Yields:
+        ------
+            Every page decoded into the page model, in page order.
+
+        Raises:
+        ------
+            FireflyPaginationError: If the endpoint reports more than `max_pages`
+                pages, or returns another page than the one requested.
+
+        """
+        params = params or {}
+        if limit is None and self._page_size_tuner is not None:
+            limit = self._page_size_tuner.limit(uri)
+        if limit is None:
+            limit = self._page_size
+        if limit is not None:
+            params = {**params, "limit": limit}
+
+        first_page = await self._request_page(uri, page_model, params, 1)
+        fingerprint = self._check_page(uri, first_page, 1, None)
+
+        total_pages = int(first_page.meta.pagination.total_pages or 1)
+        if total_pages > self._max_pages:
+            msg = f"Endpoint {uri} reports {total_pages} pages, more than the maximum of {self._max_pages}"
+            raise FireflyPaginationError(msg)
+
+        pending: deque[asyncio.Task[PageT]] = deque()
+        next_page = 2
+
+        def _prefetch() -> None:
+            nonlocal next_page
+            while next_page <= total_pages and len(pending) < self._max_concurrent_pages:
+                pending.append(asyncio.ensure_future(self._request_page(uri, page_model, params, next_page)))
+                next_page += 1
+
+        pages = 1
+        try:
+            _prefetch()
+            yield first_page
+            for page_number in range(2, total_pages + 1):
+                page = await pending.popleft()
+                fingerprint = self._check_page(uri, page, page_number, fingerprint)
+                _prefetch()
+                pages = page_number
+                yield page
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for instrumentation in self._instrumentation:
+                instrumentation.paginated(endpoint_name(uri), pages)
+
+    async def _request_page(self, uri: str, page_model: type[PageT], params: dict[str, Any], page_number: int) -> PageT:
+        """Request a single page of a paginated endpoint.
+
+        With adaptive page sizes enabled, the response time and body size of the
+        page are recorded to tune the page size of the endpoint. The response
+        time only covers the attempt that succeeded and decoding, not waiting
+        for the rate limiter, an in-flight slot or a retry, so throttling by the
+        client does not shrink the pages.
+
+        Args:
+        ----
+            uri: Request URI of the paginated endpoint.
+            page_model: The page model to decode the page into.
+            params: Extra options to improve or limit the response.
+            page_number: The number of the page to request.
+
+        Returns:
+        -------
+            The page decoded into the page model.
+
+        """
+        tuner = self._page_size_tuner
+        if tuner is None:
+            page: PageT = await self._request(uri, params={**params, "page": page_number}, decoder=page_model.from_json)
+            return page
+
+        size = 0
+        decode_seconds = 0.0
+
+        def _decode(body: bytes) -> PageT:
+            nonlocal size, decode_seconds
+            size = len(body)
+            started_at = time.perf_counter()
+            decoded = page_model.from_json(body)
+            decode_seconds = time.perf_counter() - started_at
+            return decoded
+
+        timing = _AttemptTiming()
+        token = _attempt_timing.set(timing)
+        try:
+            page = await self._request(uri, params={**params, "page": page_number}, decoder=_decode)
+        finally:
+            _attempt_timing.reset(token)
+        # A request coalesced with an identical one in flight is timed by the other caller
+        if timing.seconds is not None:
+            tuner.record(uri, items=len(page.data), seconds=timing.seconds + decode_seconds, size=size, limit=params.get("limit"))
+        return page
+
+    @staticmethod
+    def _check_page(uri: str, page: Page[Any], page_number: int, previous: tuple[Any, ...] | None) -> tuple[Any, ...]:
+        """Check a page is the requested page, and not a repeat of the previous page.
+
+        Args:
+        ----
+            uri: Request URI of the paginated endpoint.
+            page: The decoded page.
+            page_number: The number of the page that was requested.
+            previous: The fingerprint of the previous page, if any.
+
+        Returns:
+        -------
+            The fingerprint of the page: the IDs of the resources on it.
+
+        Raises:
+        ------
+            FireflyPaginationError: If the server returned another page than requested.
+
+        """
+        current_page = page.meta.pagination.current_page
+        if current_page is not None and current_page != page_number:
+            msg = f"Requested page {page_number} of {uri}, but received page {current_page}"
+            raise FireflyPaginationError(msg)
+
+        fingerprint = tuple(item.get("id") if isinstance(item, dict) else getattr(item, "id", None) for item in page.data)
+        if fingerprint and fingerprint == previous:
+            msg = f"Page {page_number} of {uri} repeats the previous page"
+            raise FireflyPaginationError(msg)
+        return fingerprint
+
+    async def _cached(self, uri: str, fetch: Callable[[], Awaitable[T]], params: dict[str, Any] | None = None) -> T:
+        """Return a parsed response from the cache, or fetch and cache it.
+
+        Args:
+        ----
+            uri: Request URI the response belongs to, used as cache key.
+            fetch: Coroutine function fetching and parsing the response.
+            params: The parameters of the request, used as cache key.
+
+        Returns:
+        -------
+            The parsed response.
+
+        """
+        if self._cache is None:
+            return await fetch()
 
-    def _format_date(self, date_value: datetime | str) -> str:
+        cached: T | None = self._cache.get(uri, params)
+        if cached is not None:
+            return cached
+
+        value = await fetch()
+        self._cache.set(uri, params, value)
+        return value
+
+    def _format_date(self, date_value: date | str) -> str:
         """Format a date value to a string in 'YYYY-MM-DD' format.
 
         Args:
@@ -163,7 +886,7 @@ class Firefly:
             A string formatted as 'YYYY-MM-DD'.
 
         """
-        if isinstance(date_value, datetime):
+        if isinstance(date_value, date):
             return date_value.strftime("%Y-%m-%d")
         return date_value
 
@@ -175,114 +898,650 @@ class Firefly:
             An About object with information about the Firefly server.
 
         """
-        about = await self._request("about")
-        return About.from_dict(about["data"])
 
-    async def get_accounts(self) -> list[Account]:
+        async def _fetch() -> About:
+            about = await self._request("about")
+            return About.from_dict(about["data"])
+
+        return await self._cached("about", _fetch)
+
+    async def iter_accounts(self, limit: int | None = None, account_type: str | None = None) -> AsyncGenerator[Account, None]:
+        """Iterate over the accounts on the Firefly server, page by page.
+
+        Args:
+        ----
+            limit: Number of resources per page. Defaults to the page size of the client.
+            account_type: Only return accounts of this type, filtered by the server,
+                for example, 'asset', 'expense' or 'liabilities'.
+
+        Yields:
+        ------
+            Account objects, as soon as the page containing them has arrived.
+
+        """
+        params = {"type": account_type} if account_type else None
+        async for page in self._iter_pages("accounts", AccountPage, params=params, limit=limit):
+            for acc in page.data:
+                yield acc
+
+    async def get_accounts(self, limit: int | None = None, account_type: str | None = None) -> list[Account]:
         """Get a list of accounts from the Firefly server.
 
-        Returns
+        Args:
+        ----
+            limit: Number of resources per page. Defaults to the page size of the client.
+            account_type: Only return accounts of this type, filtered by the server,
+                for example, 'asset', 'expense' or 'liabilities'.
+
+        Returns:
         -------
             A list of Account objects containing account information.
 
         """
-        accounts: list[dict[str, str]] = []
-        next_page: int | None = 1
 
-        while next_page:
-            response = await self._request(
-                uri="accounts",
-                method="GET",
-                params={"page": next_page},
-            )
+        async def _fetch() -> list[Account]:
+            return [acc async for acc in self.iter_accounts(limit, account_type)]
 
-            accounts.extend(response["data"])
+        return await self._cached("accounts", _fetch, {"type": account_type} if account_type else None)
 
-            # Check for the next page in the pagination metadata
-            pagination = response.get("meta", {}).get("pagination", {})
-            current_page = int(pagination.get("current_page", 1) or 1)
-            total_pages = int(pagination.get("total_pages", 1) or 1)
+    async def iter_search_accounts(
+        self,
+        query: str,
+        field: str = "all",
+        account_type: str | None = None,
+        limit: int | None = None,
+    ) -> AsyncGenerator[Account, None]:
+        """Search for accounts on the Firefly server, page by page.
 
-            next_page = current_page + 1 if current_page < total_pages else None
+        Args:
+        ----
+            query: The text to search for.
+            field: The account field to search in: 'all', 'iban', 'name', 'number' or 'id'.
+            account_type: Only return accounts of this type, for example, 'asset'.
+            limit: Number of resources per page. Defaults to the page size of the client.
 
-        return [Account.from_dict(acc) for acc in accounts]
+        Yields:
+        ------
+            Matching Account objects, as soon as the page containing them has arrived.
 
-    async def get_transactions(
+        """
+        params = {"query": query, "field": field}
+        if account_type:
+            params["type"] = account_type
+        async for page in self._iter_pages("search/accounts", AccountPage, params=params, limit=limit):
+            for acc in page.data:
+                yield acc
+
+    async def search_accounts(
         self,
-        account_id: int | None = None,
-        start: datetime | None = None,
-        end: datetime | None = None,
-    ) -> list[Transaction]:
-        """Get transactions for a specific account. Else, return all transactions.
+        query: str,
+        field: str = "all",
+        account_type: str | None = None,
+        limit: int | None = None,
+    ) -> list[Account]:
+        """Search for accounts on the Firefly server.
+
+        Args:
+        ----
+            query: The text to search for.
+            field: The account field to search in: 'all', 'iban', 'name', 'number' or 'id'.
+            account_type: Only return accounts of this type, for example, 'asset'.
+            limit: Number of resources per page. Defaults to the page size of the client.
+
+        Returns:
+        -------
+            A list of matching Account objects.
+
+        """
+        return [acc async for acc in self.iter_search_accounts(query, field, account_type, limit)]
+
+    def _transactions_request(
+        self,
+        account_id: int | None,
+        start: date | None,
+        end: date | None,
+        transaction_type: str | None = None,
+    ) -> tuple[str, dict[str, str]]:
+        """Build the URI and parameters to list transactions.
 
         Args:
         ----
             account_id: The ID of the account to retrieve transactions for.
             start: The start date for the transactions.
             end: The end date for the transactions.
+            transaction_type: Only list transactions of this type.
 
         Returns:
         -------
-            A list of transactions for the specified account.
+            The request URI and parameters.
 
         """
-        transactions: list[dict[str, Any]] = []
-        next_page: int | None = 1
-
         uri = f"accounts/{account_id}/transactions"
         if account_id is None:
             uri = "transactions"
 
-        while next_page:
-            params: dict[str, str] = {"page": str(next_page)}
-            if start:
-                params["start"] = self._format_date(start)
-            if end:
-                params["end"] = self._format_date(end)
-
-            response = await self._request(
-                uri=uri,
-                method="GET",
-                params=params,
-            )
+        params: dict[str, str] = {}
+        if start:
+            params["start"] = self._format_date(start)
+        if end:
+            params["end"] = self._format_date(end)
+        if transaction_type:
+            params["type"] = transaction_type
+        return uri, params
 
-            transactions.extend(response["data"])
+    async def iter_transactions(
+        self,
+        account_id: int | None = None,
+        start: date | None = None,
+        end: date | None = None,
+        limit: int | None = None,
+        transaction_type: str | None = None,
+    ) -> AsyncGenerator[TransactionResource, None]:
+        """Iterate over transactions for a specific account, or all transactions, page by page.
 
-            pagination = response.get("meta", {}).get("pagination", {})
-            current_page = int(pagination.get("current_page", 1) or 1)
-            total_pages = int(pagination.get("total_pages", 1) or 1)
+        Args:
+        ----
+            account_id: The ID of the account to retrieve transactions for.
+            start: The start date for the transactions.
+            end: The end date for the transactions.
+            limit: Number of resources per page. Defaults to the page size of the client.
+            transaction_type: Only return transactions of this type, filtered by
+                the server, for example, 'withdrawal', 'deposit' or 'transfer'.
 
-            next_page = current_page + 1 if current_page < total_pages else None
+        Yields:
+        ------
+            Transaction resources (groups of splits), as soon as the page containing
+            them has arrived.
 
-        return [Transaction.from_dict(tx) for tx in transactions]
+        """
+        uri, params = self._transactions_request(account_id, start, end, transaction_type)
+        async for page in self._iter_pages(uri, TransactionPage, params=params, limit=limit):
+            for tx in page.data:
+                yield tx
 
-    async def get_categories(self) -> list[Category]:
-        """Get all categories from the Firefly server.
+    async def get_transactions(  # noqa: PLR0913  # pylint: disable=too-many-arguments
+        self,
+        account_id: int | None = None,
+        start: date | None = None,
+        end: date | None = None,
+        limit: int | None = None,
+        *,
+        shard: Literal["month", "week"] | None = None,
+        transaction_type: str | None = None,
+    ) -> list[TransactionResource]:
+        """Get transactions for a specific account. Else, return all transactions.
 
-        Returns
+        Args:
+        ----
+            account_id: The ID of the account to retrieve transactions for.
+            start: The start date for the transactions.
+            end: The end date for the transactions.
+            limit: Number of resources per page. Defaults to the page size of the client.
+            shard: Split the date range into calendar months or weeks, and fetch
+                these shards concurrently, with at most `max_concurrent_pages`
+                shards at a time. This keeps page offsets shallow when
+                downloading a long history. Each shard prefetches up to
+                `max_concurrent_pages` pages itself, so set `max_in_flight` to
+                cap the total number of requests. If fetching one shard fails,
+                the others are cancelled. Requires both start and end dates.
+            transaction_type: Only return transactions of this type, filtered by
+                the server, for example, 'withdrawal', 'deposit' or 'transfer'.
+
+        Returns:
         -------
-            A list of Category objects containing category information.
+            A list of transaction resources for the specified account. The splits
+            of each transaction are in `attributes.transactions`.
+
+        Raises:
+        ------
+            ValueError: When sharding without both a start and end date.
+
+        """
+        if shard is None:
+            return [tx async for tx in self.iter_transactions(account_id, start, end, limit, transaction_type)]
+
+        if start is None or end is None:
+            msg = "start and end are required to shard transactions"
+            raise ValueError(msg)
+
+        semaphore = asyncio.Semaphore(self._max_concurrent_pages)
+
+        async def fetch(shard_start: date, shard_end: date) -> list[TransactionResource]:
+            async with semaphore:
+                return [tx async for tx in self.iter_transactions(account_id, shard_start, shard_end, limit, transaction_type)]
+
+        # Firefly lists transactions newest first, so stitch the shards newest first
+        shards = await _gather(fetch(shard_start, shard_end) for shard_start, shard_end in reversed(_date_shards(start, end, shard)))
+        return [tx for transactions in shards for tx in transactions]
+
+    async def iter_search_transactions(self, query: str, limit: int | None = None) -> AsyncGenerator[TransactionResource, None]:
+        """Search for transactions on the Firefly server, page by page.
+
+        The query uses the search syntax of Firefly III, for example,
+        `category:"Groceries" amount_more:50 date_after:2025-01-01`, so only the
+        matching transactions are transferred.
+
+        Args:
+        ----
+            query: The search query.
+            limit: Number of resources per page. Defaults to the page size of the client.
+
+        Yields:
+        ------
+            Matching transaction resources, as soon as the page containing them has arrived.
+
+        """
+        async for page in self._iter_pages("search/transactions", TransactionPage, params={"query": query}, limit=limit):
+            for tx in page.data:
+                yield tx
+
+    async def search_transactions(self, query: str, limit: int | None = None) -> list[TransactionResource]:
+        """Search for transactions on the Firefly server.
+
+        Args:
+        ----
+            query: The search query, in the search syntax of Firefly III.
+            limit: Number of resources per page. Defaults to the page size of the client.
+
+        Returns:
+        -------
+            A list of matching transaction resources.
+
+        """
+        return [tx async for tx in self.iter_search_transactions(query, limit)]
+
+    async def get_transactions_for_accounts(
+        self,
+        account_ids: Iterable[int],
+        start: date | None = None,
+        end: date | None = None,
+        limit: int | None = None,
+    ) -> list[TransactionResource]:
+        """Get the transactions of multiple accounts, merged into a single list.
+
+        The transactions of the accounts are fetched concurrently, with at most
+        `max_concurrent_pages` accounts at a time. Each account prefetches up to
+        `max_concurrent_pages` pages itself, so set `max_in_flight` to cap the
+        total number of requests. If fetching one account fails, the others are
+        cancelled. Transactions between two of
+        the accounts, such as transfers, are returned once: transactions are
+        deduplicated by their journal IDs before they are decoded.
+
+        Args:
+        ----
+            account_ids: The IDs of the accounts to retrieve transactions for.
+            start: The start date for the transactions.
+            end: The end date for the transactions.
+            limit: Number of resources per page. Defaults to the page size of the client.
+
+        Returns:
+        -------
+            A list of transaction resources, newest first, like the Firefly API
+            orders transactions.
+
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrent_pages)
+        seen: set[str] = set()
+        transactions: list[TransactionResource] = []
+
+        async def fetch(account_id: int) -> None:
+            uri, params = self._transactions_request(account_id, start, end)
+            async with semaphore:
+                async for page in self._iter_pages(uri, RawPage, params=params, limit=limit):
+                    for group in page.data:
+                        splits = group.get("attributes", {}).get("transactions") or []
+                        journal_ids = {str(split["transaction_journal_id"]) for split in splits if split.get("transaction_journal_id")}
+                        journal_ids = journal_ids or {f"group/{group['id']}"}
+                        if journal_ids & seen:
+                            continue
+                        seen.update(journal_ids)
+                        transactions.append(TransactionResource.from_dict(group))
+
+        await _gather(fetch(account_id) for account_id in dict.fromkeys(account_ids))
+        transactions.sort(key=self._transaction_date, reverse=True)
+        return transactions
+
+    @staticmethod
+    def _transaction_date(resource: TransactionResource) -> datetime:
+        """Get the date of a transaction group, to order transactions by."""
+        splits = resource.attributes.transactions or []
+        if not splits or not splits[0].date:
+            return datetime.min.replace(tzinfo=UTC)
+        value = datetime.fromisoformat(splits[0].date)
+        return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+    async def iter_transaction_splits(
+        self,
+        account_id: int | None = None,
+        start: date | None = None,
+        end: date | None = None,
+        limit: int | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Iterate over a flattened view of transactions, with one row per split.
+
+        The rows are the plain JSON decoded splits, with the ID of their transaction
+        group added as `transaction_group_id`. No models are built, which makes this
+        the fastest way to feed transactions into bulk analytics.
+
+        Args:
+        ----
+            account_id: The ID of the account to retrieve transactions for.
+            start: The start date for the transactions.
+            end: The end date for the transactions.
+            limit: Number of resources per page. Defaults to the page size of the client.
+
+        Yields:
+        ------
+            One dictionary per split, as soon as the page containing it has arrived.
+
+        """
+        uri, params = self._transactions_request(account_id, start, end)
+        async for page in self._iter_pages(uri, RawPage, params=params, limit=limit):
+            for group in page.data:
+                for split in group.get("attributes", {}).get("transactions") or []:
+                    split["transaction_group_id"] = group["id"]
+                    yield split
+
+    async def iter_compact_transactions(
+        self,
+        account_id: int | None = None,
+        start: date | None = None,
+        end: date | None = None,
+        limit: int | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncGenerator[Transaction, None]:
+        """Iterate over transactions as compact models, with one model per split.
+
+        The splits are decoded into a slotted variant of `Transaction`, created
+        with `compact_model`. Decoding only the needed fields, for example,
+        `("transaction_journal_id", "date", "amount", "category_id")`, keeps the
+        memory use of large downloads low.
+
+        Args:
+        ----
+            account_id: The ID of the account to retrieve transactions for.
+            start: The start date for the transactions.
+            end: The end date for the transactions.
+            limit: Number of resources per page. Defaults to the page size of the client.
+            fields: The fields of `Transaction` to decode. Defaults to all fields.
+
+        Yields:
+        ------
+            One compact model per split, as soon as the page containing it has arrived.
 
         """
-        categories: list[dict[str, str]] = []
-        next_page: int | None = 1
+        model = compact_model(Transaction, tuple(fields) if fields is not None else None)
+        async for split in self.iter_transaction_splits(account_id, start, end, limit):
+            yield model.from_dict(split)
+
+    async def export_transactions(
+        self,
+        account_id: int | None = None,
+        start: date | None = None,
+        end: date | None = None,
+        limit: int | None = None,
+    ) -> TransactionColumns:
+        """Export transactions into columns, with one row per split.
+
+        The columns are filled straight from the decoded pages as they arrive,
+        without building a model per split.
+
+        Args:
+        ----
+            account_id: The ID of the account to retrieve transactions for.
+            start: The start date for the transactions.
+            end: The end date for the transactions.
+            limit: Number of resources per page. Defaults to the page size of the client.
+
+        Returns:
+        -------
+            The TransactionColumns, to convert with `to_arrow`, `to_parquet` or `to_numpy`.
+
+        """
+        columns = TransactionColumns()
+        async for split in self.iter_transaction_splits(account_id, start, end, limit):
+            columns.append(split)
+        return columns
+
+    async def sync_transactions(  # pylint: disable=too-many-locals
+        self,
+        cursor: TransactionSyncCursor | None = None,
+        *,
+        account_id: int | None = None,
+        start: date | None = None,
+        lookback_days: int = 7,
+    ) -> TransactionSyncResult:
+        """Fetch the transactions that changed since the previous sync.
+
+        Only transactions dated on or after the watermark of the cursor, minus a
+        lookback window, are fetched. Within that window, transaction groups are
+        compared against the groups seen by the previous sync to find the added,
+        updated and deleted ones. A group that is missing from the window is
+        requested on its own: it is only reported as deleted if it no longer
+        exists, and as updated if it was moved out of the window, for example,
+        back-dated. Other changes to transactions dated before the lookback
+        window are not detected.
+
+        Args:
+        ----
+            cursor: The cursor returned by the previous sync. Omit it to start a
+                new sync, which reports all transactions as added.
+            account_id: The ID of the account to sync transactions for, when
+                starting a new sync. Syncs all transactions if omitted.
+            start: The start date for a new sync. Fetches all transactions if omitted.
+            lookback_days: Number of days before the watermark to fetch again, to
+                catch transactions that were edited or back-dated recently.
 
-        while next_page:
-            response = await self._request(
-                uri="categories",
-                method="GET",
-                params={"page": next_page},
+        Returns:
+        -------
+            The added, updated and deleted (by group ID) transactions, and the
+            cursor to pass to the next sync.
+
+        """
+        if cursor is None:
+            cursor = TransactionSyncCursor(account_id=account_id)
+
+        today = datetime.now(UTC).date()
+        window_start = start.date() if isinstance(start, datetime) else start
+        if cursor.watermark is not None:
+            window_start = date.fromisoformat(cursor.watermark) - timedelta(days=lookback_days)
+
+        result = TransactionSyncResult(
+            cursor=TransactionSyncCursor(
+                account_id=cursor.account_id,
+                watermark=self._format_date(today),
+                last_updated_at=cursor.last_updated_at,
             )
+        )
+        seen: dict[str, SyncedTransaction] = {}
+        async for resource in self.iter_transactions(cursor.account_id, start=window_start):
+            splits = resource.attributes.transactions or []
+            synced = SyncedTransaction(
+                updated_at=resource.attributes.updated_at,
+                date=(splits[0].date or "")[:10] if splits else None,
+            )
+            seen[resource.id] = synced
+
+            previous = cursor.seen.get(resource.id)
+            if previous is None:
+                result.added.append(resource)
+            elif previous.updated_at != synced.updated_at:
+                result.updated.append(resource)
+
+            if synced.updated_at and (result.cursor.last_updated_at or "") < synced.updated_at:
+                result.cursor.last_updated_at = synced.updated_at
+
+        window = self._format_date(window_start) if window_start else ""
+        missing = [group_id for group_id, synced in cursor.seen.items() if group_id not in seen and (synced.date or "") >= window]
+        for group_id, existing in zip(missing, await _gather(self._get_transaction_or_none(group_id) for group_id in missing), strict=True):
+            if existing is None:
+                result.deleted.append(group_id)
+            else:
+                result.updated.append(existing)
+
+        # Only remember groups that the next sync will fetch again
+        next_window = self._format_date(today - timedelta(days=lookback_days))
+        result.cursor.seen = {group_id: synced for group_id, synced in seen.items() if (synced.date or next_window) >= next_window}
+        return result
+
+    async def _get_transaction_or_none(self, group_id: str) -> TransactionResource | None:
+        """Get a transaction group by its ID, or None if it does not exist.
+
+        Args:
+        ----
+            group_id: The ID of the transaction group.
+
+        Returns:
+        -------
+            The transaction resource, or None if the server reports it as not found.
+
+        """
+        try:
+            response = await self._request(f"transactions/{group_id}")
+        except FireflyNotFoundError:
+            return None
+        return TransactionResource.from_dict(response["data"])
+
+    async def create_transaction(self, transaction: TransactionStore) -> TransactionResource:
+        """Create a transaction on the Firefly server.
+
+        Args:
+        ----
+            transaction: The transaction to create, with one or more splits.
+
+        Returns:
+        -------
+            The created transaction resource.
+
+        Raises:
+        ------
+            FireflyValidationError: If the server rejected the transaction, for
+                example, as a duplicate of an existing transaction.
+
+        """
+        response = await self._request("transactions", method=METH_POST, data=transaction.to_jsonb())
+        if self._cache is not None:
+            # Creating a transaction changes the balances of its accounts
+            self._cache.invalidate("accounts")
+        return TransactionResource.from_dict(response["data"])
 
-            categories.extend(response["data"])
+    async def create_transactions(
+        self,
+        transactions: Iterable[TransactionStore],
+        *,
+        skip_external_ids: Iterable[str] = (),
+        error_if_duplicate_hash: bool = True,
+        max_concurrency: int | None = None,
+    ) -> TransactionBulkResult:
+        """Create many transactions on the Firefly server, concurrently.
+
+        Transactions are skipped as duplicates, without submitting them, if a
+        split has an `external_id` that is in `skip_external_ids` or in an earlier
+        transaction of the batch. Transactions that the server rejects as a
+        duplicate of an existing transaction (by its `import_hash_v2`) are
+        reported as duplicates too, so an import can safely be run again.
+
+        Args:
+        ----
+            transactions: The transactions to create.
+            skip_external_ids: External IDs of transactions that were already imported.
+            error_if_duplicate_hash: Let the server reject transactions that are
+                identical to an existing transaction, unless the transaction sets
+                `error_if_duplicate_hash` itself.
+            max_concurrency: Maximum number of transactions created concurrently.
+                Defaults to `max_concurrent_pages`.
+
+        Returns:
+        -------
+            The created transactions, the skipped duplicates, and the transactions
+            that failed, together with their error.
+
+        """
+        result = TransactionBulkResult()
+        seen = set(skip_external_ids)
+        pending: list[TransactionStore] = []
+        for transaction in transactions:
+            external_ids = {split.external_id for split in transaction.transactions if split.external_id}
+            if external_ids & seen:
+                result.duplicates.append(transaction)
+                continue
+            seen.update(external_ids)
+            pending.append(transaction)
+
+        semaphore = asyncio.Semaphore(max_concurrency or self._max_concurrent_pages)
+
+        async def create(transaction: TransactionStore) -> TransactionResource | FireflyError:
+            if transaction.error_if_duplicate_hash is None:
+                transaction = replace(transaction, error_if_duplicate_hash=error_if_duplicate_hash)
+            async with semaphore:
+                try:
+                    return await self.create_transaction(transaction)
+                except FireflyError as err:
+                    return err
+
+        outcomes = await asyncio.gather(*(create(transaction) for transaction in pending))
+        for transaction, outcome in zip(pending, outcomes, strict=True):
+            if isinstance(outcome, TransactionResource):
+                result.created.append(outcome)
+            elif isinstance(outcome, FireflyValidationError) and self._is_duplicate_error(outcome):
+                result.duplicates.append(transaction)
+            else:
+                result.errors.append((transaction, outcome))
+        return result
+
+    @staticmethod
+    def _is_duplicate_error(error: FireflyValidationError) -> bool:
+        """Check a validation error is the rejection of a duplicate transaction.
+
+        Args:
+        ----
+            error: The validation error of a created transaction.
+
+        Returns:
+        -------
+            True if the message, or one of the field errors, of the server
+            reports the transaction as a duplicate of an existing transaction.
+
+        """
+        details = error.args[1] if len(error.args) > 1 and isinstance(error.args[1], dict) else {}
+        messages = [details.get("message")]
+        for field_errors in (details.get("errors") or {}).values():
+            messages.extend(field_errors if isinstance(field_errors, list) else [field_errors])
+        return any(isinstance(message, str) and message.lower().startswith("duplicate of transaction") for message in messages)
+
+    async def iter_categories(self, limit: int | None = None) -> AsyncGenerator[Category, None]:
+        """Iterate over the categories on the Firefly server, page by page.
+
+        Args:
+        ----
+            limit: Number of resources per page. Defaults to the page size of the client.
+
+        Yields:
+        ------
+            Category objects, as soon as the page containing them has arrived.
+
+        """
+        async for page in self._iter_pages("categories", CategoryPage, limit=limit):
+            for cat in page.data:
+                yield cat
+
+    async def get_categories(self, limit: int | None = None) -> list[Category]:
+        """Get all categories from the Firefly server.
+
+        Args:
+        ----
+            limit: Number of resources per page. Defaults to the page size of the client.
 
-            pagination = response.get("meta", {}).get("pagination", {})
-            current_page = int(pagination.get("current_page", 1) or 1)
-            total_pages = int(pagination.get("total_pages", 1) or 1)
+        Returns:
+        -------
+            A list of Category objects containing category information.
+
+        """
 
-            next_page = current_page + 1 if current_page < total_pages else None
+        async def _fetch() -> list[Category]:
+            return [cat async for cat in self.iter_categories(limit)]
 
-        return [Category.from_dict(cat) for cat in categories]
+        return await self._cached("categories", _fetch)
 
     async def get_category(
         self,
@@ -349,35 +1608,105 @@ class Firefly:
         budget_limits = await self._request(uri=f"budgets/{budget_id}/limits", params=params)
         return [BudgetLimitAttributes.from_dict(limit) for limit in budget_limits["data"]]
 
-    async def get_bills(self, start: datetime | None = None, end: datetime | None = None) -> list[Bill]:
-        """Get bills for the Firefly server. Both start and end dates are required for date range filtering.
+    async def get_all_budget_limits(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        budget_ids: Iterable[str | int] | None = None,
+    ) -> dict[str, list[BudgetLimit]]:
+        """Get the budget limits of all, or selected, budgets at once.
+
+        With both start and end dates, all limits in the date range are fetched
+        from the `/budget-limits` endpoint in a single paginated walk. Otherwise,
+        the limits of every budget are fetched concurrently, with at most
+        `max_concurrent_pages` budgets at a time. Each budget prefetches up to
+        `max_concurrent_pages` pages itself, so set `max_in_flight` to cap the
+        total number of requests. If fetching one budget fails, the others are
+        cancelled.
+
+        Args:
+        ----
+            start: The start date for the budget limits.
+            end: The end date for the budget limits.
+            budget_ids: The IDs of the budgets to retrieve limits for. Defaults to all budgets.
+
+        Returns:
+        -------
+            A dictionary with the budget limits per budget ID. Selected budgets
+            without limits map to an empty list.
+
+        """
+        selected = {str(budget_id) for budget_id in budget_ids} if budget_ids is not None else None
+
+        if start and end:
+            params = {"start": self._format_date(start), "end": self._format_date(end)}
+            limits: dict[str, list[BudgetLimit]] = {budget_id: [] for budget_id in sorted(selected or ())}
+            async for page in self._iter_pages("budget-limits", BudgetLimitPage, params=params):
+                for limit in page.data:
+                    budget_id = limit.attributes.budget_id
+                    if budget_id is not None and (selected is None or budget_id in selected):
+                        limits.setdefault(budget_id, []).append(limit)
+            return limits
+
+        if selected is None:
+            selected = {budget.id async for page in self._iter_pages("budgets", BudgetPage) for budget in page.data}
+
+        semaphore = asyncio.Semaphore(self._max_concurrent_pages)
+
+        async def fetch(budget_id: str) -> list[BudgetLimit]:
+            async with semaphore:
+                return [limit async for page in self._iter_pages(f"budgets/{budget_id}/limits", BudgetLimitPage) for limit in page.data]
+
+        ordered = sorted(selected)
+        results = await _gather(fetch(budget_id) for budget_id in ordered)
+        return dict(zip(ordered, results, strict=True))
+
+    async def iter_bills(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = None,
+    ) -> AsyncGenerator[Bill, None]:
+        """Iterate over the bills on the Firefly server, page by page.
+
+        Both start and end dates are required for date range filtering.
 
         Args:
             start: The start date for the bills.
             end: The end date for the bills.
+            limit: Number of resources per page. Defaults to the page size of the client.
 
-        Returns:
-            A list of Bill containing bill information.
+        Yields:
+            Bill objects, as soon as the page containing them has arrived.
 
         """
-        bills: list[dict[str, Any]] = []
-        next_page: int | None = 1
-        params: dict[str, str] = {"page": str(next_page)}
+        params: dict[str, str] = {}
         if start and end:
             params["start"] = self._format_date(start)
             params["end"] = self._format_date(end)
 
-        while next_page:
-            response = await self._request(uri="bills", params=params)
-            bills.extend(response["data"])
+        async for page in self._iter_pages("bills", BillPage, params=params, limit=limit):
+            for bill in page.data:
+                yield bill
+
+    async def get_bills(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[Bill]:
+        """Get bills for the Firefly server. Both start and end dates are required for date range filtering.
 
-            pagination = response.get("meta", {}).get("pagination", {})
-            current_page = int(pagination.get("current_page", 1) or 1)
-            total_pages = int(pagination.get("total_pages", 1) or 1)
+        Args:
+            start: The start date for the bills.
+            end: The end date for the bills.
+            limit: Number of resources per page. Defaults to the page size of the client.
 
-            next_page = current_page + 1 if current_page < total_pages else None
+        Returns:
+            A list of Bill containing bill information.
 
-        return [Bill.from_dict(bill) for bill in bills]
+        """
+        return [bill async for bill in self.iter_bills(start, end, limit)]
 
     async def get_preferences(self) -> list[Preferences]:
         """Get preferences from the Firefly server.
@@ -387,8 +1716,12 @@ class Firefly:
             A list of Preferences objects containing the preferences.
 
         """
-        preferences = await self._request("preferences")
-        return [Preferences.from_dict(pref) for pref in preferences["data"]]
+
+        async def _fetch() -> list[Preferences]:
+            preferences = await self._request("preferences")
+            return [Preferences.from_dict(pref) for pref in preferences["data"]]
+
+        return await self._cached("preferences", _fetch)
 
     async def get_currencies(self) -> list[Currency]:
         """Get currencies from the Firefly server.
@@ -398,8 +1731,12 @@ class Firefly:
             A list of Currency objects containing the currencies.
 
         """
-        currencies = await self._request("currencies")
-        return [Currency.from_dict(cur) for cur in currencies["data"]]
+
+        async def _fetch() -> list[Currency]:
+            currencies = await self._request("currencies")
+            return [Currency.from_dict(cur) for cur in currencies["data"]]
+
+        return await self._cached("currencies", _fetch)
 
     async def get_currency_primary(self) -> Currency:
         """Get the primary currency of the current administration.
@@ -409,8 +1746,115 @@ class Firefly:
             A Currency object containing the primary currency symbol.
 
         """
-        currency = await self._request("currencies/primary")
-        return Currency.from_dict(currency["data"])
+
+        async def _fetch() -> Currency:
+            currency = await self._request("currencies/primary")
+            return Currency.from_dict(currency["data"])
+
+        return await self._cached("currencies/primary", _fetch)
+
+    def _aggregate_params(self, start: date, end: date, account_ids: Iterable[int | str] | None = None) -> dict[str, Any]:
+        """Build the parameters of an aggregate (summary, insight or chart) endpoint.
+
+        Args:
+        ----
+            start: The start date of the period.
+            end: The end date of the period.
+            account_ids: Only aggregate the transactions of these accounts.
+
+        Returns:
+        -------
+            The request parameters.
+
+        """
+        params: dict[str, Any] = {"start": self._format_date(start), "end": self._format_date(end)}
+        if account_ids is not None:
+            params["accounts[]"] = [str(account_id) for account_id in account_ids]
+        return params
+
+    async def get_basic_summary(self, start: date, end: date, currency_code: str | None = None) -> dict[str, BasicSummaryEntry]:
+        """Get the basic summary of a period, like balances, spent and earned per currency.
+
+        Summaries, insights and charts change with every new transaction, so
+        they are not kept in the response cache of the client.
+
+        Args:
+        ----
+            start: The start date of the period.
+            end: The end date of the period.
+            currency_code: Only summarize amounts in this currency, for example, 'EUR'.
+
+        Returns:
+        -------
+            A dictionary of BasicSummaryEntry objects by key, for example, 'spent-in-EUR'.
+
+        """
+        params = self._aggregate_params(start, end)
+        if currency_code:
+            params["currency_code"] = currency_code
+
+        summary = await self._request("summary/basic", params=params)
+        return {key: BasicSummaryEntry.from_dict(entry) for key, entry in summary.items()}
+
+    async def get_insight(
+        self,
+        kind: Literal["expense", "income", "transfer"],
+        group: str,
+        start: date,
+        end: date,
+        account_ids: Iterable[int | str] | None = None,
+    ) -> list[InsightEntry]:
+        """Get the totals of a period, summed by the server and grouped by, for example, category.
+
+        For example, the amount spent per category this month is the insight of
+        kind 'expense' and group 'category'.
+
+        Args:
+        ----
+            kind: The kind of transactions to sum: 'expense', 'income' or 'transfer'.
+            group: How to group the totals, for example, 'category', 'budget',
+                'tag', 'bill', 'expense', 'revenue', 'asset', or 'total' for the
+                overall total per currency.
+            start: The start date of the period.
+            end: The end date of the period.
+            account_ids: Only sum the transactions of these accounts.
+
+        Returns:
+        -------
+            A list of InsightEntry objects, one per group and currency.
+
+        """
+        params = self._aggregate_params(start, end, account_ids)
+
+        entries = await self._request(f"insight/{kind}/{group}", params=params)
+        return [InsightEntry.from_dict(entry) for entry in entries]
+
+    async def get_account_overview_chart(
+        self,
+        start: date,
+        end: date,
+        period: str | None = None,
+    ) -> list[ChartDataSet]:
+        """Get the balance over time of the accounts shown on the Firefly dashboard.
+
+        Args:
+        ----
+            start: The start date of the chart.
+            end: The end date of the chart.
+            period: The period of the chart entries, for example, '1D', '1W' or '1M'.
+
+        Returns:
+        -------
+            A list of ChartDataSet objects, one per account and currency, with the
+            balance per date in `entries`.
+
+        """
+        params = self._aggregate_params(start, end)
+        if period:
+            params["period"] = period
+
+        data_sets = await self._request("chart/account/overview", params=params)
+        return [ChartDataSet.from_dict(data_set) for data_set in data_sets]
 
     async def close(self) -> None:
         """Close open client session."""
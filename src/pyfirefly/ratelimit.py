@@ -0,0 +1,54 @@
+"""Client-side rate limiting for the Firefly API client."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class RateLimiter:  # pylint: disable=too-few-public-methods
+    """Token bucket rate limiter.
+
+    Tokens are added at a steady rate, up to the burst size. Every request takes
+    one token, and waits for a new one when the bucket is empty. Waiting callers
+    are served in order.
+    """
+
+    def __init__(self, rate: float, burst: int | None = None) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+        ----
+            rate: Number of requests per second.
+            burst: Maximum number of requests sent at once after an idle
+                period. Defaults to the rate, rounded up, with a minimum of 1.
+
+        """
+        if rate <= 0:
+            msg = "rate must be positive"
+            raise ValueError(msg)
+
+        self._rate = rate
+        self._burst = float(burst if burst is not None else max(1, int(rate + 0.999)))
+        if self._burst < 1:
+            msg = "burst must be at least 1"
+            raise ValueError(msg)
+
+        self._tokens = self._burst
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Take a token, waiting until one is available."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
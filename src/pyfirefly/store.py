@@ -0,0 +1,252 @@
+"""Local SQLite store for Firefly data."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any, Self
+
+from pyfirefly.models import Account, Budget, Category, Transaction
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from pyfirefly.models import TransactionResource, TransactionSyncResult
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    transaction_journal_id TEXT PRIMARY KEY,
+    transaction_group_id TEXT NOT NULL,
+    date TEXT,
+    source_id TEXT,
+    destination_id TEXT,
+    category_id TEXT,
+    budget_id TEXT,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_transactions_group ON transactions (transaction_group_id);
+CREATE INDEX IF NOT EXISTS ix_transactions_date ON transactions (date);
+CREATE INDEX IF NOT EXISTS ix_transactions_source ON transactions (source_id, date);
+CREATE INDEX IF NOT EXISTS ix_transactions_destination ON transactions (destination_id, date);
+CREATE INDEX IF NOT EXISTS ix_transactions_category ON transactions (category_id, date);
+CREATE INDEX IF NOT EXISTS ix_transactions_budget ON transactions (budget_id, date);
+CREATE TABLE IF NOT EXISTS accounts (id TEXT PRIMARY KEY, data BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS categories (id TEXT PRIMARY KEY, data BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS budgets (id TEXT PRIMARY KEY, data BLOB NOT NULL);
+"""
+
+
+class FireflyStore:
+    """Local SQLite store for transactions, accounts, categories and budgets.
+
+    Fetched models are written to a local SQLite database, with indexes on the
+    date, account, category and budget of transactions. Queries return the
+    regular model classes, so reports can be answered from the local database
+    instead of paging through the Firefly API again.
+
+    The store uses the blocking `sqlite3` module. Queries on the local indexes
+    are fast, but run large writes outside the event loop if latency matters.
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        """Initialize the store, creating the database schema if needed.
+
+        Args:
+        ----
+            path: Path of the SQLite database file. Defaults to an in-memory database.
+
+        """
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> Self:
+        """Enter the store context.
+
+        Returns
+        -------
+            The FireflyStore object.
+
+        """
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Exit the store context, closing the database connection.
+
+        Args:
+        ----
+            _exc_info: Exec type.
+
+        """
+        self.close()
+
+    def add_transactions(self, transactions: Iterable[TransactionResource]) -> None:
+        """Insert or replace transaction groups, one row per split.
+
+        Args:
+        ----
+            transactions: The transaction groups to store.
+
+        """
+        with self._connection:
+            for resource in transactions:
+                self._connection.execute("DELETE FROM transactions WHERE transaction_group_id = ?", (resource.id,))
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            split.transaction_journal_id or f"{resource.id}/{index}",
+                            resource.id,
+                            split.date,
+                            split.source_id,
+                            split.destination_id,
+                            split.category_id,
+                            split.budget_id,
+                            split.to_jsonb(),
+                        )
+                        for index, split in enumerate(resource.attributes.transactions or [])
+                    ],
+                )
+
+    def delete_transactions(self, group_ids: Iterable[str]) -> None:
+        """Delete transaction groups.
+
+        Args:
+        ----
+            group_ids: The IDs of the transaction groups to delete.
+
+        """
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM transactions WHERE transaction_group_id = ?",
+                [(group_id,) for group_id in group_ids],
+            )
+
+    def apply_sync(self, result: TransactionSyncResult) -> None:
+        """Apply the changes found by an incremental transaction sync.
+
+        Args:
+        ----
+            result: The result of `Firefly.sync_transactions`.
+
+        """
+        self.add_transactions([*result.added, *result.updated])
+        self.delete_transactions(result.deleted)
+
+    def add_accounts(self, accounts: Iterable[Account]) -> None:
+        """Insert or replace accounts.
+
+        Args:
+        ----
+            accounts: The accounts to store.
+
+        """
+        self._replace("accounts", ((account.id, account.to_jsonb()) for account in accounts))
+
+    def add_categories(self, categories: Iterable[Category]) -> None:
+        """Insert or replace categories.
+
+        Args:
+        ----
+            categories: The categories to store.
+
+        """
+        self._replace("categories", ((category.id, category.to_jsonb()) for category in categories))
+
+    def add_budgets(self, budgets: Iterable[Budget]) -> None:
+        """Insert or replace budgets.
+
+        Args:
+        ----
+            budgets: The budgets to store.
+
+        """
+        self._replace("budgets", ((budget.id, budget.to_jsonb()) for budget in budgets))
+
+    def _replace(self, table: str, rows: Iterable[tuple[str, bytes]]) -> None:
+        """Insert or replace rows of a table with an ID and data column."""
+        with self._connection:
+            self._connection.executemany(f"INSERT OR REPLACE INTO {table} VALUES (?, ?)", rows)  # noqa: S608
+
+    def transactions(
+        self,
+        *,
+        start: date | None = None,
+        end: date | None = None,
+        account_id: str | None = None,
+        category_id: str | None = None,
+        budget_id: str | None = None,
+    ) -> list[Transaction]:
+        """Query stored transactions, one per split, ordered by date.
+
+        Args:
+        ----
+            start: Only return transactions on or after this date.
+            end: Only return transactions on or before this date.
+            account_id: Only return transactions from or to this account.
+            category_id: Only return transactions in this category.
+            budget_id: Only return transactions in this budget.
+
+        Returns:
+        -------
+            A list of Transaction objects matching all given filters.
+
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if start is not None:
+            clauses.append("date >= ?")
+            params.append(start.isoformat())
+        if end is not None:
+            clauses.append("date < ?")
+            params.append((end + timedelta(days=1)).isoformat())
+        if account_id is not None:
+            clauses.append("(source_id = ? OR destination_id = ?)")
+            params.extend([account_id, account_id])
+        if category_id is not None:
+            clauses.append("category_id = ?")
+            params.append(category_id)
+        if budget_id is not None:
+            clauses.append("budget_id = ?")
+            params.append(budget_id)
+
+        query = "SELECT data FROM transactions"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY date, transaction_journal_id"
+
+        return [Transaction.from_json(row[0]) for row in self._connection.execute(query, params)]
+
+    def accounts(self) -> list[Account]:
+        """Get all stored accounts.
+
+        Returns
+        -------
+            A list of Account objects.
+
+        """
+        return [Account.from_json(row[0]) for row in self._connection.execute("SELECT data FROM accounts ORDER BY id")]
+
+    def categories(self) -> list[Category]:
+        """Get all stored categories.
+
+        Returns
+        -------
+            A list of Category objects.
+
+        """
+        return [Category.from_json(row[0]) for row in self._connection.execute("SELECT data FROM categories ORDER BY id")]
+
+    def budgets(self) -> list[Budget]:
+        """Get all stored budgets.
+
+        Returns
+        -------
+            A list of Budget objects.
+
+        """
+        return [Budget.from_json(row[0]) for row in self._connection.execute("SELECT data FROM budgets ORDER BY id")]
@@ -0,0 +1,82 @@
+"""Adaptive page size tuning for the Firefly API client."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class _EndpointStats:
+    """Smoothed cost per resource of the pages of one endpoint."""
+
+    seconds_per_item: float
+    bytes_per_item: float
+    limit: int
+
+
+@dataclass
+class PageSizeTuner:
+    """Pick the page size of paginated endpoints from measured page costs.
+
+    Every fetched page is recorded with its response time and body size. The
+    page size of the next walk of the same endpoint is chosen so a page takes
+    about `target_fraction` of the request timeout and stays below
+    `max_page_bytes`, growing at most `max_growth` times per walk. The page size
+    never changes halfway through a walk, as that would shift the page offsets.
+    """
+
+    request_timeout: float
+    min_limit: int = 10
+    max_limit: int = 1000
+    target_fraction: float = 0.25
+    max_page_bytes: int = 4 * 1024 * 1024
+    max_growth: float = 2.0
+    smoothing: float = 0.3
+
+    _stats: dict[str, _EndpointStats] = field(default_factory=dict, init=False, repr=False)
+
+    def limit(self, uri: str) -> int | None:
+        """Get the page size to use for the next walk of an endpoint.
+
+        Args:
+        ----
+            uri: Request URI of the paginated endpoint.
+
+        Returns:
+        -------
+            The page size, or None to use the server default until the endpoint
+            has been measured.
+
+        """
+        stats = self._stats.get(uri)
+        return stats.limit if stats else None
+
+    def record(self, uri: str, *, items: int, seconds: float, size: int, limit: int | None = None) -> None:
+        """Record the cost of a fetched page and update the page size of the endpoint.
+
+        Args:
+        ----
+            uri: Request URI of the paginated endpoint.
+            items: Number of resources on the page.
+            seconds: Time it took to fetch and decode the page.
+            size: Size of the response body (in bytes).
+            limit: The page size of the walk the page belongs to, or None if
+                the server default was used. Growth is capped against it, so
+                the pages of a single walk cannot compound the growth.
+
+        """
+        if items <= 0:
+            return
+
+        seconds_per_item = seconds / items
+        bytes_per_item = size / items
+        stats = self._stats.get(uri)
+        if stats is None:
+            stats = self._stats[uri] = _EndpointStats(seconds_per_item, bytes_per_item, items)
+        else:
+            stats.seconds_per_item += self.smoothing * (seconds_per_item - stats.seconds_per_item)
+            stats.bytes_per_item += self.smoothing * (bytes_per_item - stats.bytes_per_item)
+
+        target = self.request_timeout * self.target_fraction / max(stats.seconds_per_item, 1e-9)
+        target = min(target, self.max_page_bytes / max(stats.bytes_per_item, 1.0), max(items, limit or 0) * self.max_growth)
+        stats.limit = max(self.min_limit, min(self.max_limit, int(target)))
@@ -0,0 +1,107 @@
+"""Tests for the response cache of the pyfirefly library."""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from aresponses import ResponsesMockServer
+
+from pyfirefly import Firefly, ResponseCache
+
+from . import load_fixtures
+
+
+def test_cache_lru_eviction() -> None:
+    """Test the least recently used response is evicted once the cache is full."""
+    cache = ResponseCache(max_size=2)
+    cache.set("about", None, "about")
+    cache.set("accounts", None, "accounts")
+    assert cache.get("about") == "about"
+
+    cache.set("categories", None, "categories")
+    assert len(cache) == 2
+    assert cache.get("accounts") is None
+    assert cache.get("about") == "about"
+    assert cache.get("categories") == "categories"
+
+
+def test_cache_ttl() -> None:
+    """Test cached responses expire after their per-endpoint TTL."""
+    cache = ResponseCache(default_ttl=60, ttls={"about": 3600, "preferences": 0})
+    with patch("pyfirefly.cache.time.monotonic", return_value=1000.0):
+        cache.set("about", None, "about")
+        cache.set("accounts", None, "accounts")
+        cache.set("preferences", None, "preferences")
+
+    assert cache.get("preferences") is None
+    with patch("pyfirefly.cache.time.monotonic", return_value=1100.0):
+        assert cache.get("about") == "about"
+        assert cache.get("accounts") is None
+    assert len(cache) == 1
+
+
+def test_cache_params_and_invalidation() -> None:
+    """Test responses are keyed by parameters and can be invalidated."""
+    cache = ResponseCache()
+    cache.set("categories/1", {"start": "2025-01-01"}, "with range")
+    cache.set("categories/1", None, "without range")
+    cache.set("about", None, "about")
+
+    assert cache.get("categories/1", {"start": "2025-01-01"}) == "with range"
+    assert cache.get("categories/1") == "without range"
+
+    cache.invalidate("categories/1")
+    assert cache.get("categories/1", {"start": "2025-01-01"}) is None
+    assert cache.get("about") == "about"
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_cache_invalid_size() -> None:
+    """Test an invalid cache size is rejected."""
+    with pytest.raises(ValueError, match="max_size"):
+        ResponseCache(max_size=0)
+
+
+async def test_cached_client(aresponses: ResponsesMockServer) -> None:
+    """Test a cache hit skips the request to the Firefly API."""
+    aresponses.add(
+        "localhost:9000",
+        "/api/v1/currencies",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=load_fixtures("currencies.json"),
+        ),
+    )
+
+    cache = ResponseCache()
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key", cache=cache) as client:
+        currencies = await client.get_currencies()
+        assert await client.get_currencies() is currencies
+
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_aggregates_not_cached(aresponses: ResponsesMockServer) -> None:
+    """Test summaries are requested again, as they change with every transaction."""
+    for _ in range(2):
+        aresponses.add(
+            "localhost:9000",
+            "/api/v1/summary/basic",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/vnd.api+json"},
+                text=load_fixtures("summary_basic.json"),
+            ),
+            match_querystring=False,
+        )
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key", cache=ResponseCache()) as client:
+        await client.get_basic_summary(date(2025, 1, 1), date(2025, 1, 31))
+        await client.get_basic_summary(date(2025, 1, 1), date(2025, 1, 31))
+
+    aresponses.assert_plan_strictly_followed()
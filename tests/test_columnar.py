@@ -0,0 +1,115 @@
+"""Tests for the columnar export of the pyfirefly library."""
+
+import math
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from aresponses import ResponsesMockServer
+
+from pyfirefly import Firefly, TransactionColumns
+from pyfirefly.columnar import MISSING_DATE
+
+from . import load_fixtures
+
+SPLITS: list[dict[str, Any]] = [
+    {
+        "transaction_journal_id": "1",
+        "transaction_group_id": "10",
+        "date": "2025-01-01T12:00:00+01:00",
+        "amount": "12.345",
+        "currency_decimal_places": 3,
+        "currency_code": "BHD",
+        "category_id": "4",
+    },
+    {"transaction_journal_id": "2", "transaction_group_id": "11", "date": None, "amount": None},
+]
+
+
+def test_columns() -> None:
+    """Test splits are converted into numeric and string columns."""
+    columns = TransactionColumns()
+    columns.extend(SPLITS)
+
+    assert len(columns) == 2
+    assert list(columns.amount_minor) == [12345, 0]
+    assert columns.amount[0] == 12.345
+    assert math.isnan(columns.amount[1])
+    assert list(columns.currency_decimal_places) == [3, 2]
+    assert list(columns.date) == [1735729200000000, MISSING_DATE]
+    assert columns.strings["category_id"] == ["4", None]
+    assert columns.strings["transaction_group_id"] == ["10", "11"]
+
+    # Currencies without decimals are not scaled
+    columns.append({"amount": "1500", "currency_decimal_places": 0, "currency_code": "JPY"})
+    assert columns.amount_minor[2] == 1500
+    assert columns.amount[2] == 1500.0
+    assert columns.currency_decimal_places[2] == 0
+
+    # Dates without a time zone are in UTC, invalid dates are missing
+    columns.extend([{"date": "2025-01-01"}, {"date": "yesterday"}])
+    assert list(columns.date[3:]) == [1735689600000000, MISSING_DATE]
+
+
+def test_columns_missing_dependency() -> None:
+    """Test a helpful error is raised without the optional dependencies."""
+    columns = TransactionColumns()
+    with (
+        patch("pyfirefly.columnar.importlib.import_module", side_effect=ImportError),
+        pytest.raises(ImportError, match=r"pip install pyfirefly\[arrow\]"),
+    ):
+        columns.to_arrow()
+
+
+def test_columns_to_numpy() -> None:
+    """Test the columns are converted to NumPy arrays."""
+    np = pytest.importorskip("numpy")
+    columns = TransactionColumns()
+    columns.extend(SPLITS)
+
+    arrays = columns.to_numpy()
+    assert arrays["amount_minor"].tolist() == [12345, 0]
+    assert arrays["date"][0] == np.datetime64("2025-01-01T11:00:00", "us")
+    assert np.isnat(arrays["date"][1])
+    assert arrays["category_id"].tolist() == ["4", None]
+
+    with patch("pyfirefly.columnar.TransactionColumns.to_arrow", side_effect=ImportError):
+        assert columns.to_columns().keys() == arrays.keys()
+
+
+def test_columns_to_arrow(tmp_path: Path) -> None:
+    """Test the columns are converted to an Arrow table and written to Parquet."""
+    pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    columns = TransactionColumns()
+    columns.extend(SPLITS)
+
+    table = columns.to_columns()
+    assert table.column("amount").to_pylist() == [12.345, None]
+    assert table.column("date").null_count == 1
+    assert str(table.schema.field("date").type) == "timestamp[us, tz=UTC]"
+
+    columns.to_parquet(tmp_path / "transactions.parquet")
+    assert parquet.read_table(tmp_path / "transactions.parquet").equals(table)
+
+
+async def test_export_transactions(aresponses: ResponsesMockServer) -> None:
+    """Test transactions are exported into columns."""
+    aresponses.add(
+        "localhost:9000",
+        "/api/v1/accounts/1/transactions",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=load_fixtures("account_transactions.json"),
+        ),
+    )
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key") as client:
+        columns = await client.export_transactions(1)
+
+    assert len(columns) == 3
+    assert columns.strings["transaction_journal_id"] == ["10421", "10422", "10423"]
+    assert columns.strings["transaction_group_id"] == ["2", "2", "2"]
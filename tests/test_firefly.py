@@ -2,11 +2,18 @@
 
 # pylint: disable=protected-access
 import asyncio
-from unittest.mock import patch
+import json
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from email.utils import format_datetime
+from typing import Any
+from unittest.mock import Mock, patch
 
 import pytest
-from aiohttp import ClientError, ClientResponse, ClientSession
+from aiohttp import ClientError, ClientResponse, ClientResponseError, ClientSession, TCPConnector
+from aiohttp.web_request import BaseRequest
 from aresponses import Response, ResponsesMockServer
+from multidict import CIMultiDict
 
 from pyfirefly import Firefly
 from pyfirefly.exceptions import (
@@ -14,8 +21,14 @@ from pyfirefly.exceptions import (
     FireflyConnectionError,
     FireflyError,
     FireflyNotFoundError,
+    FireflyPaginationError,
     FireflyTimeoutError,
+    FireflyValidationError,
 )
+from pyfirefly.models import AccountPage, TransactionSplitStore, TransactionStore, TransactionSyncCursor
+from pyfirefly.pyfirefly import _date_shards, _gather
+
+from . import load_fixtures
 
 
 async def test_json_request(
@@ -128,3 +141,885 @@ async def test_response_status(
     )
     with pytest.raises(expected_exception):
         await firefly_client._request("test")
+
+
+async def test_paginated_request_concurrent(aresponses: ResponsesMockServer) -> None:
+    """Test remaining pages are fetched concurrently and returned in page order."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def response_handler(request: BaseRequest) -> Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        page = int(request.query["page"])
+        # Answer later pages faster, so completion order differs from page order
+        await asyncio.sleep(0.01 * (6 - page))
+        in_flight -= 1
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=json.dumps(
+                {
+                    "data": [{"type": "accounts", "id": str(page), "attributes": {}}],
+                    "meta": {"pagination": {"current_page": page, "total_pages": 5}},
+                }
+            ),
+        )
+
+    aresponses.add("localhost:9000", "/api/v1/accounts", "GET", response_handler, repeat=5)
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key", max_concurrent_pages=2) as client:
+        accounts = await client.get_accounts()
+
+    assert [account.id for account in accounts] == ["1", "2", "3", "4", "5"]
+    assert max_in_flight == 2
+
+
+async def test_invalid_max_concurrent_pages() -> None:
+    """Test an invalid page concurrency cap is rejected."""
+    with pytest.raises(ValueError, match="max_concurrent_pages"):
+        Firefly(api_url="http://localhost:9000/", api_key="test_api_key", max_concurrent_pages=0)
+
+
+async def test_iter_stops_early(aresponses: ResponsesMockServer) -> None:
+    """Test breaking out of an iterator stops fetching further pages."""
+    requested_pages: list[int] = []
+
+    async def response_handler(request: BaseRequest) -> Response:
+        page = int(request.query["page"])
+        requested_pages.append(page)
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=json.dumps(
+                {
+                    "data": [{"type": "categories", "id": str(page), "attributes": {}}],
+                    "meta": {"pagination": {"current_page": page, "total_pages": 10}},
+                }
+            ),
+        )
+
+    aresponses.add("localhost:9000", "/api/v1/categories", "GET", response_handler, repeat=aresponses.INFINITY)
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key", max_concurrent_pages=2) as client:
+        iterator = client.iter_categories()
+        category = await anext(iterator)
+        await iterator.aclose()
+
+    assert category.id == "1"
+    assert max(requested_pages) <= 3
+
+
+async def test_request_decoder(
+    aresponses: ResponsesMockServer,
+    firefly_client: Firefly,
+) -> None:
+    """Test the raw response body is handed to a custom decoder."""
+    aresponses.add(
+        "localhost:9000",
+        "/api/v1/test",
+        "GET",
+        aresponses.Response(status=200, headers={"Content-Type": "application/json"}, text='{"data": []}'),
+    )
+    response = await firefly_client._request("test", decoder=AccountPage.from_json)
+    assert response == AccountPage(data=[])
+
+
+async def test_conditional_requests(aresponses: ResponsesMockServer) -> None:
+    """Test responses are revalidated with their validators and served on a 304."""
+    body = load_fixtures("accounts.json")
+
+    async def response_handler(request: BaseRequest) -> Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            assert request.headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+            return aresponses.Response(status=304)
+        return aresponses.Response(
+            status=200,
+            headers={
+                "Content-Type": "application/vnd.api+json",
+                "ETag": '"v1"',
+                "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+            },
+            text=body,
+        )
+
+    aresponses.add("localhost:9000", "/api/v1/accounts", "GET", response_handler, repeat=2)
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key", conditional_requests=True) as client:
+        accounts = await client.get_accounts()
+        assert await client.get_accounts() == accounts
+
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_conditional_requests_evicted(aresponses: ResponsesMockServer) -> None:
+    """Test a 304 is served from the revalidated response, even if it was evicted meanwhile."""
+    client = Firefly(api_url="http://localhost:9000/", api_key="test_api_key", conditional_requests=True)
+
+    async def response_handler(request: BaseRequest) -> Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            client._conditional_responses.clear()
+            return aresponses.Response(status=304)
+        return aresponses.Response(status=200, headers={"Content-Type": "application/json", "ETag": '"v1"'}, text='{"version": 1}')
+
+    aresponses.add("localhost:9000", "/api/v1/test", "GET", response_handler, repeat=2)
+
+    async with client:
+        assert await client._request("test") == {"version": 1}
+        assert await client._request("test") == {"version": 1}
+        assert not client._conditional_responses
+
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_conditional_requests_without_validators(aresponses: ResponsesMockServer) -> None:
+    """Test responses without validators are not remembered."""
+    aresponses.add(
+        "localhost:9000",
+        "/api/v1/test",
+        "GET",
+        aresponses.Response(status=200, headers={"Content-Type": "application/json"}, text="{}"),
+    )
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key", conditional_requests=True) as client:
+        assert await client._request("test", params={"page": 1}) == {}
+        assert not client._conditional_responses
+
+
+async def test_sync_transactions(aresponses: ResponsesMockServer) -> None:
+    """Test an incremental sync reports added, updated and deleted transactions."""
+    today = datetime.now(UTC).date().isoformat()
+
+    def group(group_id: str, updated_at: str) -> dict[str, Any]:
+        return {
+            "type": "transactions",
+            "id": group_id,
+            "attributes": {
+                "updated_at": updated_at,
+                "transactions": [{"transaction_journal_id": group_id, "date": f"{today}T12:00:00+01:00"}],
+            },
+        }
+
+    responses = [
+        [group("1", "2025-01-01T10:00:00+01:00"), group("2", "2025-01-01T10:00:00+01:00")],
+        [group("1", "2025-01-02T10:00:00+01:00"), group("3", "2025-01-02T11:00:00+01:00")],
+    ]
+    requested_starts: list[str | None] = []
+
+    async def response_handler(request: BaseRequest) -> Response:
+        requested_starts.append(request.query.get("start"))
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=json.dumps({"data": responses.pop(0)}),
+        )
+
+    aresponses.add("localhost:9000", "/api/v1/transactions", "GET", response_handler, repeat=2)
+    aresponses.add("localhost:9000", "/api/v1/transactions/2", "GET", aresponses.Response(status=404, text="Not found"))
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key") as client:
+        first = await client.sync_transactions()
+        assert [tx.id for tx in first.added] == ["1", "2"]
+        assert first.cursor.watermark == today
+
+        cursor = TransactionSyncCursor.from_json(first.cursor.to_json())
+        second = await client.sync_transactions(cursor, lookback_days=3)
+
+    assert [tx.id for tx in second.added] == ["3"]
+    assert [tx.id for tx in second.updated] == ["1"]
+    assert second.deleted == ["2"]
+    assert second.cursor.last_updated_at == "2025-01-02T11:00:00+01:00"
+    assert set(second.cursor.seen) == {"1", "3"}
+    assert requested_starts == [None, (datetime.now(UTC).date() - timedelta(days=3)).isoformat()]
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_sync_transactions_back_dated(aresponses: ResponsesMockServer) -> None:
+    """Test a transaction back-dated to before the sync window is reported as updated, not deleted."""
+    today = datetime.now(UTC).date()
+
+    def group(transaction_date: date) -> dict[str, Any]:
+        return {
+            "type": "transactions",
+            "id": "1",
+            "attributes": {
+                "updated_at": f"{today}T10:00:00+01:00",
+                "transactions": [{"transaction_journal_id": "1", "date": f"{transaction_date}T12:00:00+01:00"}],
+            },
+        }
+
+    responses = [[group(today)], []]
+
+    async def response_handler(_: BaseRequest) -> Response:
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=json.dumps({"data": responses.pop(0)}),
+        )
+
+    aresponses.add("localhost:9000", "/api/v1/transactions", "GET", response_handler, repeat=2)
+    aresponses.add(
+        "localhost:9000",
+        "/api/v1/transactions/1",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=json.dumps({"data": group(today - timedelta(days=60))}),
+        ),
+    )
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key") as client:
+        first = await client.sync_transactions(start=today)
+        second = await client.sync_transactions(first.cursor)
+
+    assert second.deleted == []
+    assert [tx.id for tx in second.updated] == ["1"]
+    assert (second.updated[0].attributes.transactions or [])[0].date == f"{today - timedelta(days=60)}T12:00:00+01:00"
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_bills_pagination(aresponses: ResponsesMockServer) -> None:
+    """Test every page of bills is requested once, with the date range kept."""
+    requested: list[tuple[str, str, str]] = []
+
+    async def response_handler(request: BaseRequest) -> Response:
+        page = int(request.query["page"])
+        requested.append((request.query["page"], request.query["start"], request.query["end"]))
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=json.dumps(
+                {
+                    "data": [{"type": "bills", "id": str(page), "attributes": {}}],
+                    "meta": {"pagination": {"current_page": page, "total_pages": 3}},
+                }
+            ),
+        )
+
+    aresponses.add("localhost:9000", "/api/v1/bills", "GET", response_handler, repeat=3)
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key") as client:
+        bills = await client.get_bills(start=datetime(2025, 1, 1, tzinfo=UTC), end=datetime(2025, 12, 31, tzinfo=UTC))
+
+    assert [bill.id for bill in bills] == ["1", "2", "3"]
+    assert sorted(requested) == [(str(page), "2025-01-01", "2025-12-31") for page in (1, 2, 3)]
+
+
+@pytest.mark.parametrize(
+    ("page_meta", "max_pages", "match"),
+    [
+        ({"current_page": 1, "total_pages": 3}, 10, "received page 1"),
+        ({"total_pages": 3}, 10, "repeats the previous page"),
+        ({"current_page": 1, "total_pages": 50}, 10, "more than the maximum"),
+    ],
+)
+async def test_pagination_guards(
+    aresponses: ResponsesMockServer,
+    page_meta: dict[str, int],
+    max_pages: int,
+    match: str,
+) -> None:
+    """Test a server returning the same page over and over cannot make the client loop."""
+    aresponses.add(
+        "localhost:9000",
+        "/api/v1/bills",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=json.dumps({"data": [{"type": "bills", "id": "1", "attributes": {}}], "meta": {"pagination": page_meta}}),
+        ),
+        repeat=aresponses.INFINITY,
+    )
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key", max_pages=max_pages) as client:
+        with pytest.raises(FireflyPaginationError, match=match):
+            await client.get_bills()
+
+
+async def test_invalid_max_pages() -> None:
+    """Test an invalid page count guard is rejected."""
+    with pytest.raises(ValueError, match="max_pages"):
+        Firefly(api_url="http://localhost:9000/", api_key="test_api_key", max_pages=0)
+
+
+async def test_iter_transaction_splits(
+    aresponses: ResponsesMockServer,
+    firefly_client: Firefly,
+) -> None:
+    """Test the flattened transaction view yields one row per split with its group ID."""
+    aresponses.add(
+        "localhost:9000",
+        "/api/v1/accounts/1/transactions",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=load_fixtures("account_transactions.json"),
+        ),
+    )
+
+    rows = [row async for row in firefly_client.iter_transaction_splits(account_id=1)]
+    assert len(rows) == 3
+    assert {row["transaction_group_id"] for row in rows} == {"2"}
+    assert rows[0]["transaction_journal_id"] == "10421"
+    assert rows[0]["amount"] == "123.45"
+
+
+async def test_iter_transaction_splits_pages(aresponses: ResponsesMockServer) -> None:
+    """Test the pages of plain JSON decoded resources are walked past the first page."""
+
+    async def response_handler(request: BaseRequest) -> Response:
+        page = int(request.query["page"])
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=json.dumps(
+                {
+                    "data": [
+                        {
+                            "type": "transactions",
+                            "id": str(page),
+                            "attributes": {"transactions": [{"transaction_journal_id": str(page * 10), "amount": "1.00"}]},
+                        }
+                    ],
+                    "meta": {"pagination": {"current_page": page, "total_pages": 3}},
+                }
+            ),
+        )
+
+    aresponses.add("localhost:9000", "/api/v1/accounts/1/transactions", "GET", response_handler, repeat=aresponses.INFINITY)
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key") as client:
+        rows = [row async for row in client.iter_transaction_splits(account_id=1)]
+
+    assert [(row["transaction_group_id"], row["transaction_journal_id"]) for row in rows] == [("1", "10"), ("2", "20"), ("3", "30")]
+
+
+async def test_retry_failed_page(aresponses: ResponsesMockServer) -> None:
+    """Test a failing page is retried on its own, keeping the pages already fetched."""
+    requested_pages: list[int] = []
+
+    async def response_handler(request: BaseRequest) -> Response:
+        page = int(request.query["page"])
+        requested_pages.append(page)
+        if page == 2 and requested_pages.count(2) == 1:
+            return aresponses.Response(status=503, text="Service unavailable")
+        if page == 3 and requested_pages.count(3) == 1:
+            await asyncio.sleep(0.2)
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=json.dumps(
+                {
+                    "data": [{"type": "transactions", "id": str(page), "attributes": {}}],
+                    "meta": {"pagination": {"current_page": page, "total_pages": 3}},
+                }
+            ),
+        )
+
+    aresponses.add("localhost:9000", "/api/v1/transactions", "GET", response_handler, repeat=5)
+
+    async with Firefly(
+        api_url="http://localhost:9000/",
+        api_key="test_api_key",
+        request_timeout=0.1,
+        max_retries=2,
+        retry_backoff=0,
+    ) as client:
+        transactions = await client.get_transactions()
+
+    assert [tx.id for tx in transactions] == ["1", "2", "3"]
+    assert sorted(requested_pages) == [1, 2, 2, 3, 3]
+
+
+@pytest.mark.parametrize(
+    ("status_code", "expected_exception"),
+    [
+        (404, FireflyNotFoundError),
+        (500, FireflyConnectionError),
+    ],
+)
+async def test_retry_exhausted(aresponses: ResponsesMockServer, status_code: int, expected_exception: type[Exception]) -> None:
+    """Test client errors are not retried, and server errors only up to max_retries."""
+    aresponses.add(
+        "localhost:9000",
+        "/api/v1/test",
+        "GET",
+        aresponses.Response(text="Error response", status=status_code),
+        repeat=3 if status_code >= 500 else 1,
+    )
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key", max_retries=2, retry_backoff=0) as client:
+        with pytest.raises(expected_exception):
+            await client._request("test")
+
+    aresponses.assert_plan_strictly_followed()
+
+
+def test_retry_delay() -> None:
+    """Test the retry delay honours Retry-After, and only retries GET requests."""
+    client = Firefly(api_url="http://localhost:9000/", api_key="test_api_key", max_retries=3, retry_backoff=1, retry_max_delay=10)
+
+    def response_error(status: int, retry_after: str | None = None) -> ClientResponseError:
+        headers = CIMultiDict({"Retry-After": retry_after} if retry_after else {})
+        return ClientResponseError(Mock(), (), status=status, headers=headers)
+
+    assert client._retry_delay("GET", 0, response_error(429, "5")) == 5
+    assert client._retry_delay("GET", 0, response_error(503, "3600")) == 10
+    assert 0 <= (client._retry_delay("GET", 2, response_error(502, "soon")) or 0) <= 4
+    assert 0 <= (client._retry_delay("GET", 1, TimeoutError()) or 0) <= 2
+    assert client._retry_delay("GET", 0, response_error(400)) is None
+    assert client._retry_delay("GET", 3, TimeoutError()) is None
+    assert client._retry_delay("POST", 0, TimeoutError()) is None
+
+    retry_at = format_datetime(datetime.now(UTC) + timedelta(seconds=8), usegmt=True)
+    assert 5 <= (client._retry_delay("GET", 0, response_error(429, retry_at)) or 0) <= 8
+
+
+async def test_internal_session_connector() -> None:
+    """Test the internally created session pools and reuses connections."""
+    async with Firefly(
+        api_url="https://localhost:9000/",
+        api_key="test_api_key",
+        connection_limit_per_host=4,
+        keepalive_timeout=90,
+        dns_cache_ttl=None,
+    ) as client:
+        session = client._create_session()
+        connector = session.connector
+        assert isinstance(connector, TCPConnector)
+        assert connector.limit_per_host == 4
+        assert connector.use_dns_cache is False
+        assert client._ssl_context is not None
+
+        ssl_context = client._ssl_context
+        await session.close()
+        session = client._create_session()
+        assert client._ssl_context is ssl_context
+        await session.close()
+
+
+async def test_coalesce_requests(aresponses: ResponsesMockServer) -> None:
+    """Test concurrent identical GET requests share a single request."""
+
+    async def response_handler(_: BaseRequest) -> Response:
+        await asyncio.sleep(0.05)
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=load_fixtures("accounts.json"),
+        )
+
+    aresponses.add("localhost:9000", "/api/v1/accounts", "GET", response_handler)
+    aresponses.add("localhost:9000", "/api/v1/accounts", "GET", response_handler)
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key", coalesce_requests=True) as client:
+        first, second, third = await asyncio.gather(client.get_accounts(), client.get_accounts(), client.get_accounts())
+        assert first == second == third
+        assert not client._pending_requests
+
+        # Once the shared request is done, a new request is sent
+        assert await client.get_accounts() == first
+
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_get_all_budget_limits_range(aresponses: ResponsesMockServer) -> None:
+    """Test budget limits in a date range are fetched from the range endpoint."""
+    aresponses.add(
+        "localhost:9000",
+        "/api/v1/budget-limits",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=load_fixtures("budget_limits.json"),
+        ),
+        match_querystring=False,
+    )
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key") as client:
+        limits = await client.get_all_budget_limits(
+            start=datetime(2025, 10, 1, tzinfo=UTC),
+            end=datetime(2025, 10, 31, tzinfo=UTC),
+            budget_ids=[23, 24],
+        )
+
+    assert list(limits) == ["23", "24"]
+    assert [limit.id for limit in limits["23"]] == ["2"]
+    assert limits["23"][0].attributes.amount == "123.45"
+    assert limits["24"] == []
+
+
+async def test_get_all_budget_limits_fan_out(aresponses: ResponsesMockServer) -> None:
+    """Test budget limits without a date range are fetched per budget."""
+    aresponses.add(
+        "localhost:9000",
+        "/api/v1/budgets",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=load_fixtures("budgets.json"),
+        ),
+    )
+    aresponses.add(
+        "localhost:9000",
+        "/api/v1/budgets/2/limits",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=load_fixtures("budget_limits.json"),
+        ),
+    )
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key") as client:
+        limits = await client.get_all_budget_limits()
+
+    assert list(limits) == ["2"]
+    assert limits["2"][0].attributes.budget_id == "23"
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_get_all_budget_limits_budget_pages(aresponses: ResponsesMockServer) -> None:
+    """Test the limits of budgets on every page of budgets are fetched."""
+
+    async def budgets_handler(request: BaseRequest) -> Response:
+        page = int(request.query["page"])
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=json.dumps(
+                {
+                    "data": [{"type": "budgets", "id": str(page), "attributes": {}}],
+                    "meta": {"pagination": {"current_page": page, "total_pages": 2}},
+                }
+            ),
+        )
+
+    async def limits_handler(request: BaseRequest) -> Response:
+        budget_id = request.path.split("/")[-2]
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=json.dumps({"data": [{"type": "budget_limits", "id": f"1{budget_id}", "attributes": {"budget_id": budget_id}}]}),
+        )
+
+    aresponses.add("localhost:9000", "/api/v1/budgets", "GET", budgets_handler, repeat=2)
+    aresponses.add("localhost:9000", "/api/v1/budgets/1/limits", "GET", limits_handler)
+    aresponses.add("localhost:9000", "/api/v1/budgets/2/limits", "GET", limits_handler)
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key") as client:
+        limits = await client.get_all_budget_limits()
+
+    assert {budget_id: [limit.id for limit in budget_limits] for budget_id, budget_limits in limits.items()} == {"1": ["11"], "2": ["12"]}
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_gather_cancels_on_error() -> None:
+    """Test the remaining fetches of a fan-out are cancelled when one fails."""
+    cancelled = asyncio.Event()
+
+    async def slow() -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return 1
+
+    async def fail() -> int:
+        await asyncio.sleep(0)
+        msg = "Budget not found"
+        raise FireflyNotFoundError(msg)
+
+    assert await _gather([asyncio.sleep(0, 1), asyncio.sleep(0, 2)]) == [1, 2]
+    with pytest.raises(FireflyNotFoundError, match="Budget not found"):
+        await _gather([slow(), fail()])
+    assert cancelled.is_set()
+
+
+async def test_get_transactions_for_accounts(aresponses: ResponsesMockServer) -> None:
+    """Test transactions of multiple accounts are merged, deduplicated and ordered."""
+    fixture = json.loads(load_fixtures("account_transactions.json"))
+    transfer = fixture["data"][0]
+    newer = json.loads(json.dumps(transfer))
+    newer["id"] = "3"
+    newer["attributes"]["transactions"] = [
+        dict(transfer["attributes"]["transactions"][0], transaction_journal_id="20000", date="2021-03-01T00:00:00+01:00")
+    ]
+
+    for account_id, groups in (("1", [transfer]), ("2", [transfer, newer])):
+        aresponses.add(
+            "localhost:9000",
+            f"/api/v1/accounts/{account_id}/transactions",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/vnd.api+json"},
+                text=json.dumps({"data": groups, "meta": fixture["meta"]}),
+            ),
+        )
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key") as client:
+        transactions = await client.get_transactions_for_accounts([1, 2, 1])
+
+    assert [transaction.id for transaction in transactions] == ["3", "2"]
+    aresponses.assert_plan_strictly_followed()
+
+
+def test_date_shards() -> None:
+    """Test date ranges are split into calendar months and weeks."""
+    assert _date_shards(date(2024, 1, 15), date(2024, 3, 10), "month") == [
+        (date(2024, 1, 15), date(2024, 1, 31)),
+        (date(2024, 2, 1), date(2024, 2, 29)),
+        (date(2024, 3, 1), date(2024, 3, 10)),
+    ]
+    assert _date_shards(datetime(2024, 12, 27, tzinfo=UTC), datetime(2025, 1, 6, tzinfo=UTC), "week") == [
+        (date(2024, 12, 27), date(2024, 12, 29)),
+        (date(2024, 12, 30), date(2025, 1, 5)),
+        (date(2025, 1, 6), date(2025, 1, 6)),
+    ]
+    assert _date_shards(date(2024, 2, 1), date(2024, 1, 1), "month") == []
+
+
+async def test_get_transactions_sharded(aresponses: ResponsesMockServer) -> None:
+    """Test a sharded date range is fetched per shard and stitched newest first."""
+    fixture = json.loads(load_fixtures("account_transactions.json"))
+    requested: list[tuple[str, str]] = []
+
+    async def response_handler(request: BaseRequest) -> Response:
+        requested.append((request.query["start"], request.query["end"]))
+        group = dict(fixture["data"][0], id=request.query["start"])
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=json.dumps({"data": [group], "meta": fixture["meta"]}),
+        )
+
+    aresponses.add("localhost:9000", "/api/v1/accounts/1/transactions", "GET", response_handler, repeat=3, match_querystring=False)
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key") as client:
+        transactions = await client.get_transactions(1, date(2025, 1, 20), date(2025, 3, 5), shard="month")
+        with pytest.raises(ValueError, match="start and end"):
+            await client.get_transactions(1, date(2025, 1, 20), shard="week")
+
+    assert sorted(requested) == [("2025-01-20", "2025-01-31"), ("2025-02-01", "2025-02-28"), ("2025-03-01", "2025-03-05")]
+    assert [transaction.id for transaction in transactions] == ["2025-03-01", "2025-02-01", "2025-01-20"]
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_iter_compact_transactions(aresponses: ResponsesMockServer) -> None:
+    """Test transactions are decoded into compact models with the selected fields."""
+    aresponses.add(
+        "localhost:9000",
+        "/api/v1/accounts/1/transactions",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=load_fixtures("account_transactions.json"),
+        ),
+    )
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key") as client:
+        transactions = [tx async for tx in client.iter_compact_transactions(1, fields=["transaction_journal_id", "date"])]
+
+    assert [tx.transaction_journal_id for tx in transactions] == ["10421", "10422", "10423"]
+    assert transactions[0].to_dict() == {"transaction_journal_id": "10421", "date": "2018-09-17T12:46:47+01:00"}
+
+
+def transaction_store(description: str, external_id: str | None = None) -> TransactionStore:
+    """Create a withdrawal to store."""
+    return TransactionStore(
+        transactions=[
+            TransactionSplitStore(
+                type="withdrawal",
+                date="2025-01-01",
+                amount="12.50",
+                description=description,
+                source_id="1",
+                external_id=external_id,
+            )
+        ]
+    )
+
+
+async def test_create_transaction(aresponses: ResponsesMockServer) -> None:
+    """Test a transaction is created with a JSON body."""
+    group = json.loads(load_fixtures("account_transactions.json"))["data"][0]
+
+    async def response_handler(request: BaseRequest) -> Response:
+        assert request.headers["Content-Type"] == "application/json"
+        assert await request.json() == {
+            "transactions": [
+                {"type": "withdrawal", "date": "2025-01-01", "amount": "12.50", "description": "Lunch", "source_id": "1"},
+            ],
+            "apply_rules": True,
+        }
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=json.dumps({"data": group}),
+        )
+
+    aresponses.add("localhost:9000", "/api/v1/transactions", "POST", response_handler)
+    aresponses.add(
+        "localhost:9000",
+        "/api/v1/transactions",
+        "POST",
+        aresponses.Response(
+            status=422,
+            headers={"Content-Type": "application/json"},
+            text='{"message": "The given data was invalid.", "errors": {"transactions.0.amount": ["The amount is invalid."]}}',
+        ),
+    )
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key") as client:
+        transaction = transaction_store("Lunch")
+        transaction.apply_rules = True
+        created = await client.create_transaction(transaction)
+        assert created.id == "2"
+
+        with pytest.raises(FireflyValidationError, match="The given data was invalid") as err:
+            await client.create_transaction(transaction)
+
+    assert err.value.args[1]["errors"] == {"transactions.0.amount": ["The amount is invalid."]}
+
+
+async def test_create_transactions(aresponses: ResponsesMockServer) -> None:
+    """Test transactions are created in bulk, skipping and collecting duplicates and errors."""
+    group = json.loads(load_fixtures("account_transactions.json"))["data"][0]
+    submitted: list[str] = []
+
+    async def response_handler(request: BaseRequest) -> Response:
+        body = await request.json()
+        assert body["error_if_duplicate_hash"] is True
+        description = body["transactions"][0]["description"]
+        submitted.append(description)
+        if description == "Duplicate":
+            return aresponses.Response(
+                status=422,
+                headers={"Content-Type": "application/json"},
+                text='{"message": "Duplicate of transaction #2.", "errors": {"transactions.0.description": ["Duplicate of transaction #2."]}}',
+            )
+        if description == "Invalid":
+            return aresponses.Response(
+                status=422,
+                headers={"Content-Type": "application/json"},
+                text='{"message": "The given data was invalid.", "errors": {"transactions.0.notes": ["No duplicate of transaction here."]}}',
+            )
+        if description == "Failing":
+            return aresponses.Response(status=500, text="Server error")
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=json.dumps({"data": group}),
+        )
+
+    aresponses.add("localhost:9000", "/api/v1/transactions", "POST", response_handler, repeat=4)
+
+    transactions = [
+        transaction_store("Created", "a"),
+        transaction_store("Repeated", "a"),
+        transaction_store("Imported", "b"),
+        transaction_store("Duplicate"),
+        transaction_store("Failing"),
+        transaction_store("Invalid"),
+    ]
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key") as client:
+        result = await client.create_transactions(transactions, skip_external_ids=["b"], max_concurrency=2)
+
+    assert sorted(submitted) == ["Created", "Duplicate", "Failing", "Invalid"]
+    assert [created.id for created in result.created] == ["2"]
+    assert result.duplicates == [transactions[1], transactions[2], transactions[3]]
+    assert len(result.errors) == 2
+    assert result.errors[0][0] is transactions[4]
+    assert isinstance(result.errors[0][1], FireflyConnectionError)
+    assert result.errors[1][0] is transactions[5]
+    assert isinstance(result.errors[1][1], FireflyValidationError)
+    assert transactions[0].error_if_duplicate_hash is None
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_search_and_type_filters(aresponses: ResponsesMockServer) -> None:
+    """Test search queries and type filters are sent to the server."""
+    queries: dict[str, dict[str, str]] = {}
+
+    def handler(path: str, fixture: str) -> Any:
+        async def response_handler(request: BaseRequest) -> Response:
+            queries[path] = dict(request.query)
+            return aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/vnd.api+json"},
+                text=load_fixtures(fixture),
+            )
+
+        return response_handler
+
+    for path, fixture in (
+        ("/api/v1/search/transactions", "account_transactions.json"),
+        ("/api/v1/search/accounts", "accounts.json"),
+        ("/api/v1/transactions", "account_transactions.json"),
+        ("/api/v1/accounts", "accounts.json"),
+    ):
+        aresponses.add("localhost:9000", path, "GET", handler(path, fixture), match_querystring=False)
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key", page_size=50) as client:
+        transactions = await client.search_transactions('category:"Groceries" amount_more:50')
+        accounts = await client.search_accounts("GB98", field="iban", account_type="asset")
+        assert [tx.id for tx in await client.get_transactions(transaction_type="withdrawal")] == [tx.id for tx in transactions]
+        assert await client.get_accounts(account_type="asset") == accounts
+
+    assert queries == {
+        "/api/v1/search/transactions": {"query": 'category:"Groceries" amount_more:50', "limit": "50", "page": "1"},
+        "/api/v1/search/accounts": {"query": "GB98", "field": "iban", "type": "asset", "limit": "50", "page": "1"},
+        "/api/v1/transactions": {"type": "withdrawal", "limit": "50", "page": "1"},
+        "/api/v1/accounts": {"type": "asset", "limit": "50", "page": "1"},
+    }
+
+
+async def test_aggregates(aresponses: ResponsesMockServer) -> None:
+    """Test summaries, insights and charts are computed by the server."""
+    queries: dict[str, dict[str, list[str]]] = {}
+
+    def handler(path: str, fixture: str) -> Any:
+        async def response_handler(request: BaseRequest) -> Response:
+            queries[path] = {key: request.query.getall(key) for key in request.query}
+            return aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/vnd.api+json"},
+                text=load_fixtures(fixture),
+            )
+
+        return response_handler
+
+    for path, fixture in (
+        ("/api/v1/summary/basic", "summary_basic.json"),
+        ("/api/v1/insight/expense/category", "insight_expense_category.json"),
+        ("/api/v1/chart/account/overview", "chart_account_overview.json"),
+    ):
+        aresponses.add("localhost:9000", path, "GET", handler(path, fixture), match_querystring=False)
+
+    start, end = date(2025, 1, 1), date(2025, 1, 31)
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key") as client:
+        summary = await client.get_basic_summary(start, end, currency_code="EUR")
+        insight = await client.get_insight("expense", "category", start, end, account_ids=[1, 2])
+        charts = await client.get_account_overview_chart(start, end, period="1D")
+
+    assert summary["balance-in-EUR"].monetary_value == 1234.5
+    assert summary["left-to-spend-in-EUR"].no_available_budgets is False
+    assert [(entry.name, entry.difference_decimal) for entry in insight] == [("Groceries", Decimal("-123.45")), ("Rent", Decimal("-800.00"))]
+    assert charts[0].y_axis_id == 0
+    assert charts[0].entries["2025-01-03T00:00:00+01:00"] == "120.25"
+
+    period = {"start": ["2025-01-01"], "end": ["2025-01-31"]}
+    assert queries == {
+        "/api/v1/summary/basic": {**period, "currency_code": ["EUR"]},
+        "/api/v1/insight/expense/category": {**period, "accounts[]": ["1", "2"]},
+        "/api/v1/chart/account/overview": {**period, "period": ["1D"]},
+    }
@@ -0,0 +1,127 @@
+"""Tests for the instrumentation of the pyfirefly library."""
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from aresponses import ResponsesMockServer
+
+from pyfirefly import Firefly, FireflyMetrics, Instrumentation, OpenTelemetryInstrumentation, RequestInfo
+from pyfirefly.exceptions import FireflyConnectionError
+from pyfirefly.instrumentation import Histogram, endpoint_name
+
+from . import load_fixtures
+
+
+class RecordingInstrumentation(Instrumentation):
+    """Instrumentation that records all hook calls."""
+
+    def __init__(self) -> None:
+        """Initialize the recorded calls."""
+        self.calls: list[tuple[str, Any]] = []
+
+    def request_start(self, method: str, endpoint: str) -> Any:
+        """Record the start of a request."""
+        self.calls.append(("start", (method, endpoint)))
+        return endpoint
+
+    def request_end(self, token: Any, info: RequestInfo) -> None:
+        """Record the end of a request."""
+        self.calls.append(("end", (token, info)))
+
+
+def test_endpoint_name() -> None:
+    """Test IDs in request URIs are replaced by a placeholder."""
+    assert endpoint_name("accounts/2/transactions") == "accounts/{id}/transactions"
+    assert endpoint_name("budgets/12") == "budgets/{id}"
+    assert endpoint_name("currencies/primary") == "currencies/primary"
+
+
+def test_histogram() -> None:
+    """Test the histogram counts observed values per bucket."""
+    histogram = Histogram(bounds=(0.1, 1.0))
+    assert histogram.quantile(0.5) == 0.0
+
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.mean == pytest.approx(0.6625)
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(1.0) == float("inf")
+
+
+async def test_metrics(aresponses: ResponsesMockServer) -> None:
+    """Test requests, page counts and trace timings are recorded per endpoint."""
+    body = load_fixtures("account_transactions.json")
+    aresponses.add(
+        "localhost:9000",
+        "/api/v1/accounts/1/transactions",
+        "GET",
+        aresponses.Response(status=200, headers={"Content-Type": "application/vnd.api+json"}, text=body),
+    )
+    aresponses.add("localhost:9000", "/api/v1/about", "GET", aresponses.Response(status=500))
+
+    metrics = FireflyMetrics()
+    recording = RecordingInstrumentation()
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key", instrumentation=[metrics, recording]) as client:
+        await client.get_transactions(1)
+        with pytest.raises(FireflyConnectionError):
+            await client.get_about()
+
+    transactions = metrics.endpoints["accounts/{id}/transactions"]
+    assert transactions.requests == 1
+    assert transactions.received_bytes == len(body.encode())
+    assert transactions.latency.count == transactions.decode.count == 1
+    assert (transactions.list_calls, transactions.pages) == (1, 1)
+
+    about = metrics.endpoints["about"]
+    assert (about.requests, about.errors, about.latency.count) == (1, 1, 0)
+
+    assert metrics.connect.count >= 1
+    assert metrics.server.count == 2
+
+    assert [name for name, _ in recording.calls] == ["start", "end", "start", "end"]
+    endpoint, info = recording.calls[3][1]
+    assert endpoint == "about"
+    assert isinstance(info.error, FireflyConnectionError)
+
+
+def test_opentelemetry_missing() -> None:
+    """Test a helpful error is raised without OpenTelemetry."""
+    with (
+        patch("pyfirefly.instrumentation.importlib.import_module", side_effect=ImportError),
+        pytest.raises(ImportError, match=r"pip install pyfirefly\[opentelemetry\]"),
+    ):
+        OpenTelemetryInstrumentation()
+
+
+async def test_opentelemetry(aresponses: ResponsesMockServer) -> None:
+    """Test a span is created for every request."""
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    exporter_module = pytest.importorskip("opentelemetry.sdk.trace.export.in_memory_span_exporter")
+    export = pytest.importorskip("opentelemetry.sdk.trace.export")
+
+    exporter = exporter_module.InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(export.SimpleSpanProcessor(exporter))
+
+    aresponses.add(
+        "localhost:9000",
+        "/api/v1/about",
+        "GET",
+        aresponses.Response(status=200, headers={"Content-Type": "application/json"}, text=load_fixtures("about.json")),
+    )
+    aresponses.add("localhost:9000", "/api/v1/about", "GET", aresponses.Response(status=500))
+
+    instrumentation = OpenTelemetryInstrumentation(provider.get_tracer("test"))
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key", instrumentation=[instrumentation]) as client:
+        await client.get_about()
+        with pytest.raises(FireflyConnectionError):
+            await client.get_about()
+
+    first, second = exporter.get_finished_spans()
+    assert first.name == "Firefly GET about"
+    assert first.attributes["http.response.body.size"] > 0
+    assert second.status.is_ok is False
@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
+import pytest
 from aresponses import ResponsesMockServer
+from mashumaro.exceptions import MissingField
 from syrupy.assertion import SnapshotAssertion
 
+from pyfirefly.models import About, AccountAttributes, BillAttributes, BudgetLimitAttributes, CurrencyAttributes, Transaction, compact_model
 from tests import load_fixtures
 
 if TYPE_CHECKING:
     from pyfirefly import Firefly
-    from pyfirefly.models import About
 
 
 async def test_about_model(
@@ -337,3 +340,61 @@ async def test_currency_primary_model(
 
     currency_primary = await firefly_client.get_currency_primary()
     assert currency_primary == snapshot
+
+
+def test_compact_model() -> None:
+    """Test compact models are slotted and only decode the selected fields."""
+    compact = compact_model(Transaction, ("transaction_journal_id", "date", "amount"))
+    assert compact is compact_model(Transaction, ("transaction_journal_id", "date", "amount"))
+    assert compact.__name__ == "CompactTransaction"
+
+    transaction = compact.from_dict({"transaction_journal_id": "1", "date": "2025-01-01", "amount": "12.50", "description": "Lunch"})
+    assert not hasattr(transaction, "__dict__")
+    assert transaction.to_dict() == {"transaction_journal_id": "1", "date": "2025-01-01", "amount": "12.50"}
+
+    # Required fields of the model stay required
+    with pytest.raises(MissingField):
+        compact_model(About, ("version",)).from_dict({})
+    assert compact_model(AccountAttributes).from_dict({"name": "Checking"}).name == "Checking"
+
+    with pytest.raises(ValueError, match="Unknown fields for Transaction: unknown"):
+        compact_model(Transaction, ("date", "unknown"))
+
+
+def test_lazy_values() -> None:
+    """Test typed values are parsed on first access and cached on the instance."""
+    transaction = Transaction.from_dict(
+        {
+            "date": "2025-01-31T12:00:00+01:00",
+            "amount": "12.345",
+            "currency_decimal_places": 3,
+            "foreign_amount": "1.5",
+            "book_date": "invalid",
+        }
+    )
+    assert "amount_decimal" not in vars(transaction)
+    assert transaction.amount_decimal == Decimal("12.345")
+    assert vars(transaction)["amount_decimal"] == Decimal("12.345")
+    assert transaction.amount_minor == 12345
+    assert transaction.foreign_amount_minor == 150
+    assert transaction.date_datetime == datetime(2025, 1, 31, 11, tzinfo=UTC)
+    assert transaction.book_date_datetime is None
+    assert transaction.due_date_datetime is None
+
+    # Lazy values are not part of the serialized model
+    assert "amount_decimal" not in transaction.to_dict()
+    assert transaction == Transaction.from_dict(transaction.to_dict())
+
+    attributes = AccountAttributes(current_balance="not a number")
+    assert attributes.current_balance_decimal is None
+    assert attributes.current_balance_minor is None
+    assert BillAttributes(date="2025-02-01").date_datetime == datetime(2025, 2, 1)  # noqa: DTZ001
+
+    # Native amounts are scaled by the decimal places of the native currency
+    bill = BillAttributes(currency_decimal_places=2, native_currency_decimal_places=0, native_amount_min="1500", amount_min="10.00")
+    assert bill.native_amount_min_minor == 1500
+    assert bill.amount_min_minor == 1000
+    limit = BudgetLimitAttributes(start_date="2025-01-01T00:00:00+00:00", native_amount="7.5", primary_currency_decimal_places=3)
+    assert limit.start_date_datetime == datetime(2025, 1, 1, tzinfo=UTC)
+    assert limit.native_amount_minor == 7500
+    assert CurrencyAttributes(created_at="2018-09-17T12:46:47+01:00").created_at_datetime == datetime(2018, 9, 17, 11, 46, 47, tzinfo=UTC)
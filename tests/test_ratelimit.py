@@ -0,0 +1,72 @@
+"""Tests for the client-side rate limiting of the pyfirefly library."""
+
+import asyncio
+import time
+
+import pytest
+from aiohttp.web_request import BaseRequest
+from aresponses import Response, ResponsesMockServer
+
+from pyfirefly import Firefly
+from pyfirefly.ratelimit import RateLimiter
+
+
+async def test_rate_limiter() -> None:
+    """Test requests beyond the burst wait for new tokens."""
+    limiter = RateLimiter(rate=50, burst=2)
+
+    started = time.monotonic()
+    for _ in range(2):
+        await limiter.acquire()
+    assert time.monotonic() - started < 0.02
+
+    await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+    assert time.monotonic() - started >= 0.09
+
+
+@pytest.mark.parametrize(
+    ("rate", "burst"),
+    [
+        (0, None),
+        (1, 0),
+    ],
+)
+def test_invalid_rate_limiter(rate: float, burst: int | None) -> None:
+    """Test an invalid rate or burst is rejected."""
+    with pytest.raises(ValueError, match="must be"):
+        RateLimiter(rate=rate, burst=burst)
+
+
+async def test_client_limits(aresponses: ResponsesMockServer) -> None:
+    """Test concurrent callers share the in-flight limit and rate limit of the client."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def response_handler(_: BaseRequest) -> Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return aresponses.Response(status=200, headers={"Content-Type": "application/json"}, text="{}")
+
+    aresponses.add("localhost:9000", "/api/v1/test", "GET", response_handler, repeat=6)
+
+    async with Firefly(
+        api_url="http://localhost:9000/",
+        api_key="test_api_key",
+        max_in_flight=2,
+        rate_limit=100,
+        rate_limit_burst=1,
+    ) as client:
+        started = time.monotonic()
+        await asyncio.gather(*(client._request("test") for _ in range(6)))
+
+    assert max_in_flight <= 2
+    assert time.monotonic() - started >= 0.05
+
+
+async def test_invalid_max_in_flight() -> None:
+    """Test an invalid in-flight limit is rejected."""
+    with pytest.raises(ValueError, match="max_in_flight"):
+        Firefly(api_url="http://localhost:9000/", api_key="test_api_key", max_in_flight=0)
@@ -0,0 +1,84 @@
+"""Tests for the local SQLite store of the pyfirefly library."""
+
+from datetime import date
+from pathlib import Path
+
+import orjson
+
+from pyfirefly import FireflyStore
+from pyfirefly.models import (
+    Account,
+    Budget,
+    Category,
+    Transaction,
+    TransactionAttributes,
+    TransactionResource,
+    TransactionSyncCursor,
+    TransactionSyncResult,
+)
+
+from . import load_fixtures
+
+
+def _group(group_id: str, *splits: Transaction) -> TransactionResource:
+    """Build a transaction group resource."""
+    return TransactionResource(type="transactions", id=group_id, attributes=TransactionAttributes(transactions=list(splits)))
+
+
+def test_store_transactions(tmp_path: Path) -> None:
+    """Test transactions are stored per split and queried by index."""
+    groceries = Transaction(
+        transaction_journal_id="10",
+        date="2025-01-15T12:00:00+01:00",
+        amount="12.50",
+        source_id="1",
+        destination_id="7",
+        category_id="3",
+        budget_id="4",
+    )
+    rent = Transaction(transaction_journal_id="11", date="2025-02-01T09:00:00+01:00", amount="800.00", source_id="1", destination_id="8")
+    salary = Transaction(transaction_journal_id="12", date="2025-02-25T09:00:00+01:00", amount="3000.00", source_id="9", destination_id="1")
+
+    with FireflyStore(tmp_path / "firefly.db") as store:
+        store.add_transactions([_group("1", groceries, rent), _group("2", salary)])
+
+        assert store.transactions() == [groceries, rent, salary]
+        assert store.transactions(category_id="3") == [groceries]
+        assert store.transactions(budget_id="4") == [groceries]
+        assert store.transactions(account_id="8") == [rent]
+        assert store.transactions(account_id="1", start=date(2025, 2, 1), end=date(2025, 2, 1)) == [rent]
+
+        # Replacing a group drops splits that no longer exist
+        store.add_transactions([_group("1", groceries)])
+        assert store.transactions(account_id="1") == [groceries, salary]
+
+    # Data survives reopening the database file
+    with FireflyStore(tmp_path / "firefly.db") as store:
+        assert len(store.transactions()) == 2
+
+
+def test_store_apply_sync() -> None:
+    """Test the changes of an incremental sync are applied to the store."""
+    first = Transaction(transaction_journal_id="1", date="2025-01-01")
+    second = Transaction(transaction_journal_id="2", date="2025-01-02")
+    with FireflyStore() as store:
+        store.add_transactions([_group("1", first)])
+        store.apply_sync(TransactionSyncResult(cursor=TransactionSyncCursor(), added=[_group("2", second)], deleted=["1"]))
+        assert store.transactions() == [second]
+
+
+def test_store_reference_data() -> None:
+    """Test accounts, categories and budgets are stored as models."""
+    accounts = [Account.from_dict(account) for account in orjson.loads(load_fixtures("accounts.json"))["data"]]
+    categories = [Category.from_dict(category) for category in orjson.loads(load_fixtures("categories.json"))["data"]]
+    budgets = [Budget.from_dict(budget) for budget in orjson.loads(load_fixtures("budgets.json"))["data"]]
+
+    with FireflyStore() as store:
+        store.add_accounts(accounts)
+        store.add_categories(categories)
+        store.add_budgets(budgets)
+        store.add_accounts(accounts[:1])
+
+        assert store.accounts() == sorted(accounts, key=lambda account: account.id)
+        assert store.categories() == sorted(categories, key=lambda category: category.id)
+        assert store.budgets() == sorted(budgets, key=lambda budget: budget.id)
@@ -0,0 +1,101 @@
+"""Tests for the adaptive page size tuning of the pyfirefly library."""
+
+# pylint: disable=protected-access
+
+import json
+
+from aiohttp.web_request import BaseRequest
+from aresponses import Response, ResponsesMockServer
+
+from pyfirefly import Firefly
+from pyfirefly.tuning import PageSizeTuner
+
+
+def test_tuner_grows_fast_pages() -> None:
+    """Test fast pages grow the page size, at most max_growth times per walk."""
+    tuner = PageSizeTuner(request_timeout=10.0)
+    assert tuner.limit("transactions") is None
+
+    tuner.record("transactions", items=50, seconds=0.05, size=50_000)
+    assert tuner.limit("transactions") == 100
+
+    # The pages of a single walk do not compound the growth
+    for _ in range(5):
+        tuner.record("transactions", items=50, seconds=0.05, size=50_000, limit=50)
+    assert tuner.limit("transactions") == 100
+
+    for _ in range(10):
+        limit = tuner.limit("transactions")
+        tuner.record("transactions", items=limit or 0, seconds=0.05, size=50_000, limit=limit)
+    assert tuner.limit("transactions") == 1000
+
+
+def test_tuner_shrinks_slow_and_large_pages() -> None:
+    """Test slow or large pages shrink the page size."""
+    tuner = PageSizeTuner(request_timeout=10.0)
+    tuner.record("transactions", items=100, seconds=5.0, size=100_000)
+    assert tuner.limit("transactions") == 50
+
+    tuner = PageSizeTuner(request_timeout=10.0, max_page_bytes=1_000_000)
+    tuner.record("accounts", items=100, seconds=0.01, size=5_000_000)
+    assert tuner.limit("accounts") == 20
+
+    tuner.record("accounts", items=0, seconds=0.01, size=10)
+    assert tuner.limit("accounts") == 20
+
+
+async def test_page_size_limit(aresponses: ResponsesMockServer) -> None:
+    """Test the page size is sent as limit, and tuned between walks."""
+    limits: list[str | None] = []
+
+    async def response_handler(request: BaseRequest) -> Response:
+        limits.append(request.query.get("limit"))
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=json.dumps({"data": [{"type": "categories", "id": str(index), "attributes": {}} for index in range(50)]}),
+        )
+
+    aresponses.add("localhost:9000", "/api/v1/categories", "GET", response_handler, repeat=4)
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key", page_size=25) as client:
+        await client.get_categories()
+        await client.get_categories(limit=500)
+
+    async with Firefly(api_url="http://localhost:9000/", api_key="test_api_key", adaptive_page_size=True) as client:
+        await client.get_categories()
+        await client.get_categories()
+
+    assert limits == ["25", "500", None, "100"]
+
+
+async def test_page_size_ignores_client_throttling(aresponses: ResponsesMockServer) -> None:
+    """Test waiting for the rate limiter does not count as the response time of a page."""
+
+    async def response_handler(request: BaseRequest) -> Response:
+        page = int(request.query["page"])
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/vnd.api+json"},
+            text=json.dumps(
+                {
+                    "data": [{"type": "categories", "id": f"{page}-{index}", "attributes": {}} for index in range(50)],
+                    "meta": {"pagination": {"current_page": page, "total_pages": 3}},
+                }
+            ),
+        )
+
+    aresponses.add("localhost:9000", "/api/v1/categories", "GET", response_handler, repeat=3)
+
+    async with Firefly(
+        api_url="http://localhost:9000/",
+        api_key="test_api_key",
+        request_timeout=2.0,
+        adaptive_page_size=True,
+        rate_limit=2,
+        rate_limit_burst=1,
+    ) as client:
+        # The last pages wait up to a second for the rate limiter, but are served instantly
+        assert len(await client.get_categories()) == 150
+        assert client._page_size_tuner is not None
+        assert client._page_size_tuner.limit("categories") == 100